@@ -143,10 +143,14 @@ engine and services. The available options can be displayed using:
 
 
 # Python imports
+import binascii
+import collections
 import logging
-import serial
+import queue
 import struct
+import threading
 import time
+import types
 
 # WeeWX imports
 import weeutil
@@ -155,12 +159,38 @@ import weewx.drivers
 import weewx.units
 from weeutil.weeutil import bcolors, timestamp_to_string
 
+# pyserial is only needed once a serial port is actually opened, so its
+# import is deferred until first use; importing this module just to display
+# help or version information then skips the pyserial import cost
+serial = None
+
+
+def _ensure_serial():
+    """Import pyserial on first use.
+
+    Raises a weewx.ViolatedPrecondition if pyserial is not installed, a
+    clearer diagnostic than a bare ImportError surfacing from deep inside
+    the driver.
+    """
+
+    global serial
+    if serial is None:
+        try:
+            import serial as _serial
+        except ImportError as e:
+            raise weewx.ViolatedPrecondition("pyserial is required but could "
+                                             "not be imported: %s" % e)
+        serial = _serial
+
+
 # get a logger object
 log = logging.getLogger(__name__)
 
-# our name and version number
+# Our name and version number. The version is also exposed via the
+# conventional __version__ attribute for tools that look for it; both names
+# are bound to the same string object.
 DRIVER_NAME = 'Aurora'
-DRIVER_VERSION = '0.7.3'
+__version__ = DRIVER_VERSION = '0.7.3'
 
 # config defaults
 DEFAULT_POLL_INTERVAL = 20
@@ -172,6 +202,125 @@ DEFAULT_MAX_COMMAND_TRIES = 3
 DEFAULT_ADDRESS = 2
 DEFAULT_WAIT_BEFORE_RETRY = 1
 
+# Pre-compiled Struct objects used to decode inverter float response data
+# and encode set_time_date payloads. They are compiled once at import time,
+# saving the format string being re-parsed for every use.
+_FLOAT_STRUCT = struct.Struct('!f')
+_INT32_STRUCT = struct.Struct('>i')
+
+# sentinel used to distinguish 'key missing' from a stored None when using
+# dict.get()
+_MISSING = object()
+
+
+# Unit data used by define_units(). Each dict is built once at import time
+# as a module level constant and merged into the corresponding WeeWX units
+# dict by define_units() with a single update() call per target dict.
+
+# unit groups used by the driver and the unit used by each group, the same
+# unit is used for all three WeeWX unit systems
+_UNIT_GROUP_DICT = {'group_resistance': 'ohm'}
+
+# default formats for units used by the driver
+_UNIT_FORMAT_DICT = {'ohm': '%.1f',
+                     'kohm': '%.1f',
+                     'Mohm': '%.1f',
+                     'megawatt_hour': '%.1f',
+                     'megawatt': '%.1f'}
+
+# default labels for units used by the driver
+_UNIT_LABEL_DICT = {'ohm': u' Ω',
+                    'kohm': u' kΩ',
+                    'Mohm': u' MΩ',
+                    'megawatt_hour': ' MWh',
+                    'megawatt': ' MW'}
+
+# Conversion functions for resistance, energy and power units used by the
+# driver. All our conversions are scalings by a power of 1000 so four named
+# functions shared across the resistance, energy and power entries replace
+# the previous per-entry lambdas. Each multiplies by a pre-computed
+# reciprocal rather than dividing, a float multiply is cheaper than a
+# divide.
+
+def _to_kilo(x):
+    """Convert a value in a base unit to kilo units, eg W to kW."""
+
+    return x * 0.001
+
+
+def _from_kilo(x):
+    """Convert a value in kilo units to the base unit, eg kW to W."""
+
+    return x * 1000.0
+
+
+def _to_mega(x):
+    """Convert a value in a base unit to mega units, eg W to MW."""
+
+    return x * 0.000001
+
+
+def _from_mega(x):
+    """Convert a value in mega units to the base unit, eg MW to W."""
+
+    return x * 1000000.0
+
+
+_CONVERSION_DICT = {
+    'ohm': {'kohm': _to_kilo,
+            'Mohm': _to_mega},
+    'kohm': {'ohm': _from_kilo,
+             'Mohm': _to_kilo},
+    'Mohm': {'ohm': _from_mega,
+             'kohm': _from_kilo},
+    'watt_hour': {'kilowatt_hour': _to_kilo,
+                  'megawatt_hour': _to_mega},
+    'kilowatt_hour': {'watt_hour': _from_kilo,
+                      'megawatt_hour': _to_kilo},
+    'megawatt_hour': {'watt_hour': _from_mega,
+                      'kilowatt_hour': _from_kilo},
+    'watt': {'kilowatt': _to_kilo,
+             'megawatt': _to_mega},
+    'kilowatt': {'watt': _from_kilo,
+                 'megawatt': _to_kilo},
+    'megawatt': {'watt': _from_mega,
+                 'kilowatt': _from_kilo}
+}
+
+# Map of database fields to unit groups. Wrapped in a read-only
+# MappingProxyType view so the mapping cannot be accidentally mutated, it
+# is shared with the live WeeWX obs_group_dict via dict.update().
+_OBS_GROUP_DICT = types.MappingProxyType({
+    'string1Voltage': 'group_volt',
+    'string1Current': 'group_amp',
+    'string1Power': 'group_power',
+    'string2Voltage': 'group_volt',
+    'string2Current': 'group_amp',
+    'string2Power': 'group_power',
+    'gridVoltage': 'group_volt',
+    'gridCurrent': 'group_amp',
+    'gridPower': 'group_power',
+    'gridFrequency': 'group_frequency',
+    'efficiency': 'group_percent',
+    'inverterTemp': 'group_temperature',
+    'boosterTemp': 'group_temperature',
+    'bulkVoltage': 'group_volt',
+    'isoResistance': 'group_resistance',
+    'in1Power': 'group_power',
+    'in2Power': 'group_power',
+    'bulkmidVoltage': 'group_volt',
+    'bulkdcVoltage': 'group_volt',
+    'leakdcCurrent': 'group_amp',
+    'leakCurrent': 'group_amp',
+    'griddcVoltage': 'group_volt',
+    'gridavgVoltage': 'group_volt',
+    'gridnVoltage': 'group_volt',
+    'griddcFrequency': 'group_frequency',
+    'energy': 'group_energy'})
+
+# has define_units() already run, used to make define_units() idempotent
+_units_defined = False
+
 
 def define_units():
     """Define unit groups, formats and conversions used by the driver.
@@ -186,80 +335,39 @@ def define_units():
     of the groups, conversions and formats the latter is an acceptable
     approach. In any case there is nothing preventing the user manually adding
     these entries to extensions.py.
+
+    The unit data itself lives in module level constant dicts, this function
+    just merges each into the corresponding WeeWX units dict with a single
+    update() call. The function is idempotent, the merge is only done on the
+    first call and any subsequent calls return immediately.
     """
 
-    # create group for resistance
-    weewx.units.USUnits['group_resistance'] = 'ohm'
-    weewx.units.MetricUnits['group_resistance'] = 'ohm'
-    weewx.units.MetricWXUnits['group_resistance'] = 'ohm'
-
-    # set default formats and labels for resistance
-    weewx.units.default_unit_format_dict['ohm'] = '%.1f'
-    weewx.units.default_unit_label_dict['ohm'] = u' Ω'
-    weewx.units.default_unit_format_dict['kohm'] = '%.1f'
-    weewx.units.default_unit_label_dict['kohm'] = u' kΩ'
-    weewx.units.default_unit_format_dict['Mohm'] = '%.1f'
-    weewx.units.default_unit_label_dict['Mohm'] = u' MΩ'
-
-    # define conversion functions for resistance
-    weewx.units.conversionDict['ohm'] = {'kohm': lambda x: x / 1000.0,
-                                         'Mohm': lambda x: x / 1000000.0}
-    weewx.units.conversionDict['kohm'] = {'ohm': lambda x: x * 1000.0,
-                                          'Mohm': lambda x: x / 1000.0}
-    weewx.units.conversionDict['Mohm'] = {'ohm': lambda x: x * 1000000.0,
-                                          'kohm': lambda x: x * 1000.0}
-
-    # set default formats and labels for megawatt hours
-    weewx.units.default_unit_format_dict['megawatt_hour'] = '%.1f'
-    weewx.units.default_unit_label_dict['megawatt_hour'] = ' MWh'
-
-    # define conversion functions for energy
-    weewx.units.conversionDict['watt_hour'] = {'kilowatt_hour': lambda x: x / 1000.0,
-                                               'megawatt_hour': lambda x: x / 1000000.0}
-    weewx.units.conversionDict['kilowatt_hour'] = {'watt_hour': lambda x: x * 1000.0,
-                                                   'megawatt_hour': lambda x: x / 1000.0}
-    weewx.units.conversionDict['megawatt_hour'] = {'watt_hour': lambda x: x * 1000000.0,
-                                                   'kilowatt_hour': lambda x: x * 1000.0}
-
-    # set default formats and labels for mega watts
-    weewx.units.default_unit_format_dict['megawatt'] = '%.1f'
-    weewx.units.default_unit_label_dict['megawatt'] = ' MW'
-
-    # define conversion functions for energy
-    weewx.units.conversionDict['watt'] = {'kilowatt': lambda x: x / 1000.0,
-                                          'megawatt': lambda x: x / 1000000.0}
-    weewx.units.conversionDict['kilowatt'] = {'watt': lambda x: x * 1000.0,
-                                              'megawatt': lambda x: x / 1000.0}
-    weewx.units.conversionDict['megawatt'] = {'watt': lambda x: x * 1000000.0,
-                                              'kilowatt': lambda x: x * 1000.0}
+    global _units_defined
+    # if our units have already been defined there is nothing to do
+    if _units_defined:
+        return
+    _units_defined = True
+
+    # create our unit groups, the same unit is used for all three WeeWX unit
+    # systems
+    weewx.units.USUnits.update(_UNIT_GROUP_DICT)
+    weewx.units.MetricUnits.update(_UNIT_GROUP_DICT)
+    weewx.units.MetricWXUnits.update(_UNIT_GROUP_DICT)
+
+    # set default formats and labels for our units
+    weewx.units.default_unit_format_dict.update(_UNIT_FORMAT_DICT)
+    weewx.units.default_unit_label_dict.update(_UNIT_LABEL_DICT)
+
+    # Define conversion functions for our units. Merge our entries into any
+    # existing per-unit conversion dict rather than replacing it outright,
+    # another driver or extension may have already registered conversions
+    # for the same source unit and a wholesale replacement would silently
+    # discard them.
+    for _unit, _mapping in _CONVERSION_DICT.items():
+        weewx.units.conversionDict.setdefault(_unit, {}).update(_mapping)
 
     # assign database fields to groups
-    weewx.units.obs_group_dict['string1Voltage'] = 'group_volt'
-    weewx.units.obs_group_dict['string1Current'] = 'group_amp'
-    weewx.units.obs_group_dict['string1Power'] = 'group_power'
-    weewx.units.obs_group_dict['string2Voltage'] = 'group_volt'
-    weewx.units.obs_group_dict['string2Current'] = 'group_amp'
-    weewx.units.obs_group_dict['string2Power'] = 'group_power'
-    weewx.units.obs_group_dict['gridVoltage'] = 'group_volt'
-    weewx.units.obs_group_dict['gridCurrent'] = 'group_amp'
-    weewx.units.obs_group_dict['gridPower'] = 'group_power'
-    weewx.units.obs_group_dict['gridFrequency'] = 'group_frequency'
-    weewx.units.obs_group_dict['efficiency'] = 'group_percent'
-    weewx.units.obs_group_dict['inverterTemp'] = 'group_temperature'
-    weewx.units.obs_group_dict['boosterTemp'] = 'group_temperature'
-    weewx.units.obs_group_dict['bulkVoltage'] = 'group_volt'
-    weewx.units.obs_group_dict['isoResistance'] = 'group_resistance'
-    weewx.units.obs_group_dict['in1Power'] = 'group_power'
-    weewx.units.obs_group_dict['in2Power'] = 'group_power'
-    weewx.units.obs_group_dict['bulkmidVoltage'] = 'group_volt'
-    weewx.units.obs_group_dict['bulkdcVoltage'] = 'group_volt'
-    weewx.units.obs_group_dict['leakdcCurrent'] = 'group_amp'
-    weewx.units.obs_group_dict['leakCurrent'] = 'group_amp'
-    weewx.units.obs_group_dict['griddcVoltage'] = 'group_volt'
-    weewx.units.obs_group_dict['gridavgVoltage'] = 'group_volt'
-    weewx.units.obs_group_dict['gridnVoltage'] = 'group_volt'
-    weewx.units.obs_group_dict['griddcFrequency'] = 'group_frequency'
-    weewx.units.obs_group_dict['energy'] = 'group_energy'
+    weewx.units.obs_group_dict.update(_OBS_GROUP_DICT)
 
 
 # ============================================================================
@@ -295,6 +403,8 @@ class DataFormatError(Exception):
     """Exception raised when an error is thrown when processing data being sent
        to or from the inverter."""
 
+    __slots__ = ()
+
 
 # ============================================================================
 #                            class AuroraDriver
@@ -304,7 +414,7 @@ class AuroraDriver(weewx.drivers.AbstractDevice):
     """Class representing connection to Aurora inverter."""
 
     # available DSP fields
-    DSP_FIELDS = ['grid_voltage', 'grid_current', 'grid_power', 'frequency',
+    DSP_FIELDS = ('grid_voltage', 'grid_current', 'grid_power', 'frequency',
                   'bulk_voltage', 'leak_dc_current', 'leak_current',
                   'string1_power', 'string2_power', 'inverter_temp',
                   'booster_temp', 'string1_voltage', 'string1_current',
@@ -315,39 +425,50 @@ class AuroraDriver(weewx.drivers.AbstractDevice):
                   'grid_voltage_neutral', 'grid_voltage_neutral_phase',
                   'time_date', 'day_energy', 'week_energy', 'month_energy',
                   'year_energy', 'total_energy', 'partial_energy'
-                  ]
-    # default sensor map, format:
-    #   loop packet field: raw data field
-    DEFAULT_SENSOR_MAP = {'inverterDateTime': 'time_date',
-                          'string1Voltage': 'string1_voltage',
-                          'string1Current': 'string1_current',
-                          'string1Power': 'string1_power',
-                          'string2Voltage': 'string2_voltage',
-                          'string2Current': 'string2_current',
-                          'string2Power': 'string2_power',
-                          'gridVoltage': 'grid_voltage',
-                          'gridCurrent': 'grid_current',
-                          'gridPower': 'grid_power',
-                          'gridFrequency': 'frequency',
-                          'inverterTemp': 'inverter_temp',
-                          'boosterTemp': 'booster_temp',
-                          'bulkVoltage': 'bulk_voltage',
-                          'isoResistance': 'isolation_resistance',
-                          'bulkmidVoltage': 'bulk_mid_voltage',
-                          'bulkdcVoltage': 'bulk_dc_voltage',
-                          'leakdcCurrent': 'leak_dc_current',
-                          'leakCurrent': 'leak_current',
-                          'griddcVoltage': 'grid_dc_voltage',
-                          'gridavgVoltage': 'grid_average_voltage',
-                          'gridnVoltage': 'grid_voltage_neutral',
-                          'griddcFrequency': 'grid_dc_frequency',
-                          'dayEnergy': 'day_energy',
-                          'weekEnergy': 'week_energy',
-                          'monthEnergy': 'month_energy',
-                          'yearEnergy': 'year_energy',
-                          'totalEnergy': 'total_energy',
-                          'partialEnergy': 'partial_energy'
-                          }
+                  )
+    # Default sensor map, format:
+    #   (loop packet field, raw data field)
+    # The primary structure is an ordered tuple of 2-way tuples, iterating a
+    # tuple is cheaper than iterating a dict's items. A dict equivalent is
+    # derived below for use where lookup by key is required.
+    DEFAULT_SENSOR_MAP_ITEMS = (('inverterDateTime', 'time_date'),
+                                ('string1Voltage', 'string1_voltage'),
+                                ('string1Current', 'string1_current'),
+                                ('string1Power', 'string1_power'),
+                                ('string2Voltage', 'string2_voltage'),
+                                ('string2Current', 'string2_current'),
+                                ('string2Power', 'string2_power'),
+                                ('gridVoltage', 'grid_voltage'),
+                                ('gridCurrent', 'grid_current'),
+                                ('gridPower', 'grid_power'),
+                                ('gridFrequency', 'frequency'),
+                                ('inverterTemp', 'inverter_temp'),
+                                ('boosterTemp', 'booster_temp'),
+                                ('bulkVoltage', 'bulk_voltage'),
+                                ('isoResistance', 'isolation_resistance'),
+                                ('bulkmidVoltage', 'bulk_mid_voltage'),
+                                ('bulkdcVoltage', 'bulk_dc_voltage'),
+                                ('leakdcCurrent', 'leak_dc_current'),
+                                ('leakCurrent', 'leak_current'),
+                                ('griddcVoltage', 'grid_dc_voltage'),
+                                ('gridavgVoltage', 'grid_average_voltage'),
+                                ('gridnVoltage', 'grid_voltage_neutral'),
+                                ('griddcFrequency', 'grid_dc_frequency'),
+                                ('dayEnergy', 'day_energy'),
+                                ('weekEnergy', 'week_energy'),
+                                ('monthEnergy', 'month_energy'),
+                                ('yearEnergy', 'year_energy'),
+                                ('totalEnergy', 'total_energy'),
+                                ('partialEnergy', 'partial_energy')
+                                )
+    # dict equivalent of the default sensor map for backwards compatible
+    # lookup by loop packet field name
+    DEFAULT_SENSOR_MAP = dict(DEFAULT_SENSOR_MAP_ITEMS)
+    # Scale factors applied to inverter fields by
+    # process_inverter_packet(), keyed by inverter field name. Currently
+    # only isolation resistance needs scaling (the inverter reports Mohm,
+    # WeeWX uses ohm) but further conversions are a one line table entry.
+    _UNIT_SCALE = {'isolation_resistance': 1000000.0}
 
     def __init__(self, **inverter_dict):
         """Initialise an object of type AuroraDriver."""
@@ -374,15 +495,6 @@ class AuroraDriver(weewx.drivers.AbstractDevice):
         write_timeout = float(inverter_dict.get('write_timeout', DEFAULT_WRITE_TIMEOUT))
         wait_before_retry = float(inverter_dict.get('wait_before_retry', DEFAULT_WAIT_BEFORE_RETRY))
         command_delay = float(inverter_dict.get('command_delay', DEFAULT_COMMAND_DELAY))
-
-        log.info("   port: '%s' baudrate: %d read_timeout: %.1f write_timeout: %.1f",
-                 port,
-                 baudrate,
-                 read_timeout,
-                 write_timeout)
-        log.info('   wait_before_retry: %.1f command_delay: %.2f',
-                 wait_before_retry,
-                 command_delay)
         # driver options
         max_command_tries = int(inverter_dict.get('max_command_tries',
                                                   DEFAULT_MAX_COMMAND_TRIES))
@@ -400,11 +512,35 @@ class AuroraDriver(weewx.drivers.AbstractDevice):
         # get the sensor map
         self.sensor_map = inverter_dict.get('sensor_map',
                                             AuroraDriver.DEFAULT_SENSOR_MAP)
-        log.info("   inverter address: %d poll_interval: %d seconds",
+        # Work out which DSP fields are actually used by the sensor map.
+        # Each DSP field costs a full serial round-trip per poll, so fields
+        # the sensor map never uses are not worth polling; the default map
+        # omits a few DSP fields and user maps are often smaller again.
+        _mapped_fields = set(self.sensor_map.values())
+        self._active_dsp_fields = tuple(f for f in AuroraDriver.DSP_FIELDS
+                                        if f in _mapped_fields)
+        # the sensor map is also needed as a tuple of items, iterating a
+        # tuple in map_inverter_packet() is cheaper than re-creating a
+        # dict items view every poll
+        self._sensor_map_items = tuple(self.sensor_map.items())
+        # Log the config being used. Consolidated into a single log call, a
+        # multi-line record is cheaper to emit than a handful of individual
+        # records each taking the logging lock in turn.
+        log.info("   port: '%s' baudrate: %d read_timeout: %.1f write_timeout: %.1f\n"
+                 "   wait_before_retry: %.1f command_delay: %.2f\n"
+                 "   inverter address: %d poll_interval: %d seconds\n"
+                 "   max_command_tries: %d\n"
+                 "   sensor_map: %s",
+                 port,
+                 baudrate,
+                 read_timeout,
+                 write_timeout,
+                 wait_before_retry,
+                 command_delay,
                  address,
-                 self.poll_interval)
-        log.info('   max_command_tries: %d ', max_command_tries)
-        log.info('   sensor_map: %s', self.sensor_map)
+                 self.poll_interval,
+                 max_command_tries,
+                 self.sensor_map)
         # get an AuroraInverter object
         self.inverter = AuroraInverter(port,
                                        baudrate=baudrate,
@@ -416,13 +552,29 @@ class AuroraDriver(weewx.drivers.AbstractDevice):
                                        max_tries=max_command_tries)
         # initialise last energy value
         self.last_energy = None
-        # build a 'none' packet to use when the inverter is offline, first
-        # create an empty dict
-        self.none_packet = {}
-        # now iterate over the fields we expect entering their 'none packet'
-        # values in the dict
-        for field in self.sensor_map.values():
-            self.none_packet[field] = None
+        # Background poller machinery. The poller thread owns all serial
+        # I/O once started and publishes each completed loop packet to a
+        # queue consumed by genLoopPackets(). A queue rather than a single
+        # slot means no packet (and hence no per-period energy delta) can
+        # be lost or double-consumed if the engine is slow collecting
+        # packets. Any exception raised in the poller is published to the
+        # same queue and re-raised in the consumer thread.
+        self._packet_queue = queue.Queue()
+        self._stop_event = threading.Event()
+        self._poll_thread = None
+        # Build a 'none' packet to use when the inverter is offline, every
+        # inverter field in the sensor map set to None. The packet is a
+        # shared sentinel that is re-used every offline poll so wrap it in a
+        # read-only mapping proxy, any accidental mutation would otherwise
+        # silently corrupt all later offline packets.
+        self.none_packet = types.MappingProxyType({field: None
+                                                   for field in self.sensor_map.values()})
+        # The mapped form of the 'none' packet is always the same, every
+        # WeeWX field in the sensor map set to None, so build it once here
+        # rather than pushing the 'none' packet through
+        # map_inverter_packet() every offline poll.
+        self._none_mapped_packet = {weewx_field: None
+                                    for weewx_field in self.sensor_map}
 
     def openPort(self):
         """Open the connection to the inverter."""
@@ -432,27 +584,91 @@ class AuroraDriver(weewx.drivers.AbstractDevice):
     def closePort(self):
         """Close the connection to the inverter."""
 
+        # stop the background poller if it is running, giving it a chance
+        # to finish any transaction in flight before the port goes away
+        self._stop_event.set()
+        if self._poll_thread is not None:
+            self._poll_thread.join(timeout=5.0)
+            self._poll_thread = None
         self.inverter.close_port()
 
     def genLoopPackets(self):
         """Generator function that returns 'loop' packets.
 
-        Poll the inverter every self.poll_interval seconds and generate a
-        loop packet. Sleep between loop packets.
+        The inverter polling runs in a background thread (see _poll_loop())
+        so the serial I/O is decoupled from the WeeWX engine's consumption
+        of loop packets. This generator starts the poller on first use then
+        just waits for each published packet and yields it. Any exception
+        raised in the poller thread is re-raised here so failures surface
+        in the engine as they would from a synchronous driver.
         """
 
-        while int(time.time()) % self.poll_interval != 0:
-            time.sleep(0.2)
+        # start the background poller on first use
+        if self._poll_thread is None:
+            self._poll_thread = threading.Thread(target=self._poll_loop,
+                                                 name='AuroraPollThread')
+            self._poll_thread.daemon = True
+            self._poll_thread.start()
+        packet_queue = self._packet_queue
         while True:
-            # get the current time as timestamp
+            # wait for the poller to publish a packet (or die)
+            _item = packet_queue.get()
+            # if the poller thread raised, the exception arrives via the
+            # queue; re-raise it here so our caller sees it
+            if isinstance(_item, BaseException):
+                raise _item
+            yield _item
+
+    def _poll_loop(self):
+        """Poll the inverter and publish loop packets.
+
+        Runs in a background daemon thread started by genLoopPackets().
+        Polls the inverter every self.poll_interval seconds, builds a loop
+        packet and publishes it to the packet queue consumed by
+        genLoopPackets(). All sleeps wait on the stop event so closePort()
+        can end the thread promptly.
+        """
+
+        try:
+            self._poll_forever()
+        except Exception as e:
+            # publish the exception to the queue, genLoopPackets() will
+            # re-raise it in the consuming thread
+            self._packet_queue.put(e)
+
+    def _poll_forever(self):
+        """The body of the background poller loop, see _poll_loop()."""
+
+        # Bind oft used instance attributes to locals, this saves the
+        # interpreter repeatedly resolving the same attributes inside the loop.
+        # These attributes do not change over the life of the driver so
+        # binding them once is safe.
+        poll_interval = self.poll_interval
+        none_packet = self.none_packet
+        inverter = self.inverter
+        stop_event = self._stop_event
+        # Align the first poll to a poll_interval boundary with a single
+        # computed sleep rather than napping in 0.2s steps until the
+        # boundary arrives. The modulo arithmetic yields the time to the
+        # next boundary directly, and zero if we are already on one.
+        _delay = -time.time() % poll_interval
+        if _delay and stop_event.wait(_delay):
+            return
+        while not stop_event.is_set():
+            # Get the current time as a timestamp for the loop packet and
+            # note the monotonic clock for the end of loop wait. The
+            # monotonic clock is immune to wall clock steps (NTP
+            # corrections, DST) so a clock jump cannot stall or rush the
+            # poll cycle.
             _ts = int(time.time())
+            _mono = time.monotonic()
             # log that we are about to poll for data
             if weewx.debug >= 2:
-                log.debug("genLoopPackets: polling inverter for data")
+                log.debug("_poll_loop: polling inverter for data")
 
             # poll the inverter and obtain a packet of inverter data
             # if the inverter is known to be running then just get the packet
-            if self.inverter.is_running:
+            if inverter.is_running:
                 _inverter_packet = self.get_dsp_packet()
             else:
                 # The inverter isn't running, but the last check may have been
@@ -460,28 +676,34 @@ class AuroraDriver(weewx.drivers.AbstractDevice):
                 # since started running. Get the inverter state, this will
                 # force an update of the inverter is_running property.
                 try:
-                    _state = self.inverter.get_state()
+                    _state = inverter.get_state()
                 except weewx.WeeWxIOError:
                     pass
                 # now try to get a data packet from the inverter, if we cannot
                 # get a data packet use a 'None' packet
-                if self.inverter.is_running:
+                if inverter.is_running:
                     # the inverter is running so get a data packet
                     _inverter_packet = self.get_dsp_packet()
                 else:
                     # the inverter is not running so use a 'None' packet
-                    _inverter_packet = self.none_packet
+                    _inverter_packet = none_packet
 
             # log the inverter data
             if weewx.debug >= 2:
-                log.debug("genLoopPackets: received inverter data packet: %s",
+                log.debug("_poll_loop: received inverter data packet: %s",
                           weeutil.weeutil.to_sorted_string(_inverter_packet))
-            # create a limited loop packet by mapping the inverter data as per
-            # the sensor map
-            packet = self.map_inverter_packet(_inverter_packet)
+            # Create a limited loop packet by mapping the inverter data as
+            # per the sensor map. The 'none' packet always maps to the same
+            # all-None result so in that case just copy the pre-built
+            # mapped equivalent, the copy is needed as the packet is
+            # augmented below.
+            if _inverter_packet is none_packet:
+                packet = dict(self._none_mapped_packet)
+            else:
+                packet = self.map_inverter_packet(_inverter_packet)
             # log the inverter data
             if weewx.debug >= 2:
-                log.debug("genLoopPackets: mapped inverter data packet: %s",
+                log.debug("_poll_loop: mapped inverter data packet: %s",
                           weeutil.weeutil.to_sorted_string(packet))
             # now add in/set any fields that require special consideration
             if packet:
@@ -493,10 +715,18 @@ class AuroraDriver(weewx.drivers.AbstractDevice):
                 # dayEnergy which is cumulative by day, but we need a
                 # per-period value. So calculate the per-period value as the
                 # difference between the current and previous dayEnergy values.
-                if 'dayEnergy' in packet:
-                    packet['energy'] = self.calculate_energy(packet['dayEnergy'],
-                                                             self.last_energy)
-                    self.last_energy = packet['dayEnergy']
+                # A single sentinel based get() distinguishes a missing
+                # dayEnergy from a present but None dayEnergy (eg an offline
+                # packet) the same way the old 'in' test did, but with one
+                # dict lookup instead of three.
+                _energy = packet.get('dayEnergy', _MISSING)
+                if _energy is not _MISSING:
+                    _last = self.last_energy
+                    if _energy is not None and _last is not None and _energy >= _last:
+                        packet['energy'] = _energy - _last
+                    else:
+                        packet['energy'] = None
+                    self.last_energy = _energy
                 else:
                     # dayEnergy is not in the packet so we should not add
                     # energy to the packet, even with a None value. However, we
@@ -504,40 +734,40 @@ class AuroraDriver(weewx.drivers.AbstractDevice):
                     self.last_energy = None
                 # log the loop packet
                 if weewx.debug >= 2:
-                    log.debug("genLoopPackets: generated loop packet: %s",
+                    log.debug("_poll_loop: generated loop packet: %s",
                               weeutil.weeutil.to_sorted_string(packet))
-                # yield the packet
-                yield packet
+                # publish the packet and wake the consumer
+                self._packet_queue.put(packet)
             # wait until it's time to poll again
             if weewx.debug >= 2:
-                log.debug("genLoopPackets: sleeping")
-            while time.time() < _ts + self.poll_interval:
-                time.sleep(0.2)
+                log.debug("_poll_loop: sleeping")
+            # Sleep in one hit until the next poll is due; a single
+            # computed sleep replaces the old 0.2s sleep-check loop, saving
+            # up to a hundred wakeups per poll interval and up to 0.2s of
+            # jitter at the poll boundary. Waiting on the stop event lets
+            # closePort() end the thread without waiting out the interval.
+            _delay = _mono + poll_interval - time.monotonic()
+            if _delay > 0 and stop_event.wait(_delay):
+                return
+
+    def get_dsp_packet(self, dsp_fields=None):
+        """Get a loop packet from the inverter.
 
-    def get_dsp_packet(self):
-        """Get a loop packet from the inverter."""
+        Input:
+            dsp_fields: The DSP fields to be polled. Optional, if omitted
+                        only the DSP fields used by the sensor map are
+                        polled; the interactive live data display passes the
+                        full DSP_FIELDS list.
+        """
 
+        if dsp_fields is None:
+            dsp_fields = self._active_dsp_fields
         # the inverter 'API' returns Metric values, so create a suitable packet
         # to save the inverter data
         _packet = {'usUnits': weewx.METRIC}
-        # iterate over the list of available DSP fields and attempt to obtain
-        # each field from the inverter
-        for dsp_field in self.DSP_FIELDS:
-            # get the field value, be prepared to catch a weewx.WeeWxIOError if
-            # the field cannot be obtained from the inverter
-            if self.inverter.is_running:
-                try:
-                    _packet[dsp_field] = self.inverter.get_field(dsp_field)
-                except weewx.WeeWxIOError:
-                    # for some reason we could not get the field, most likely
-                    # because the inverter is asleep, but it could otherwise be
-                    # off-line. In any case we should ignore the exception and
-                    # continue.
-                    continue
-            else:
-                # the inverter is not running, most likely asleeep, so there is
-                # no point continuing, break out of the loop so we can return
-                break
+        # obtain the required DSP fields from the inverter in a single
+        # batched call
+        _packet.update(self.inverter.get_fields(dsp_fields))
         # carry out any special processing on the packet
         self.process_inverter_packet(_packet)
         # finally return the packet
@@ -554,13 +784,16 @@ class AuroraDriver(weewx.drivers.AbstractDevice):
             Nothing, modifies (if required) inverter_packet in place.
         """
 
-        # isoR is reported in Mohms, we want ohms
-        if 'isolation_resistance' in inverter_packet:
-            try:
-                inverter_packet['isolation_resistance'] *= 1000000.0
-            except TypeError:
-                # field is not numeric so leave it
-                pass
+        # apply any unit scaling, eg isoR is reported in Mohms but we want
+        # ohms
+        for field, scale in AuroraDriver._UNIT_SCALE.items():
+            _value = inverter_packet.get(field)
+            if _value is not None:
+                try:
+                    inverter_packet[field] = _value * scale
+                except TypeError:
+                    # field is not numeric so leave it
+                    pass
 
     def map_inverter_packet(self, inverter_packet):
         """Map inverter data packet fields to WeeWX fields.
@@ -574,13 +807,20 @@ class AuroraDriver(weewx.drivers.AbstractDevice):
 
         # create an empty dict to hold the mapped data
         _packet = {}
-        # iterate over each sensor map entry
-        for weewx_field, inverter_field in self.sensor_map.items():
+        # bind the packet lookup as a local, one attribute resolution
+        # rather than one per sensor map entry
+        _get = inverter_packet.get
+        # Iterate over the pre-built tuple of sensor map entries. Using
+        # get() with a sentinel rather than an 'in' test followed by a
+        # subscript halves the number of key hashes, and the sentinel keeps
+        # a stored None distinct from a missing field.
+        for weewx_field, inverter_field in self._sensor_map_items:
+            _value = _get(inverter_field, _MISSING)
             # does the inverter (source) field exist
-            if inverter_field in inverter_packet:
+            if _value is not _MISSING:
                 # the inverter (source) field exists so map it to the
                 # applicable WeeWX field
-                _packet[weewx_field] = inverter_packet[inverter_field]
+                _packet[weewx_field] = _value
         # return the mapped data
         return _packet
 
@@ -645,7 +885,7 @@ class AuroraDriver(weewx.drivers.AbstractDevice):
         # WeeWxIOError raised if the inverter is asleep
         try:
             _response = self.inverter.set_time(_ts)
-        except weewx.WeeWXIOError as e:
+        except weewx.WeeWxIOError as e:
             raise NotImplementedError(e)
         except Exception as e:
             # some other exception occurred, log it and raise it
@@ -672,15 +912,6 @@ class AuroraDriver(weewx.drivers.AbstractDevice):
 
         return self.model
 
-    @staticmethod
-    def calculate_energy(newtotal, oldtotal):
-        """Calculate energy differential given two cumulative measurements."""
-
-        delta = None
-        if newtotal is not None and oldtotal is not None and newtotal >= oldtotal:
-            delta = newtotal - oldtotal
-        return delta
-
 
 # ============================================================================
 #                            class AuroraInverter
@@ -694,197 +925,214 @@ class AuroraInverter(object):
     - utilise the 'inverter API' to get inverter status/set inverter options
     """
 
+    # Declare the instance attributes as slots; attribute access via slots
+    # avoids the per-instance __dict__ and its hashing on every lookup in
+    # the comms hot path.
+    __slots__ = ('port', 'baudrate', 'address', 'read_timeout',
+                 'write_timeout', 'wait_before_retry', 'command_delay',
+                 'max_tries', '_next_write_ts', 'commands', 'field_commands',
+                 '_field_commands_resolved', '_msg_cache',
+                 'transmission_state', 'global_state', 'serial_port',
+                 '_raw_write', '_raw_read', '_port_lock')
+
     # transmission state code map
-    TRANSMISSION = {0: 'Everything is OK',
-                    51: 'Command is not implemented',
-                    52: 'Variable does not exist',
-                    53: 'Variable value is out of range',
-                    54: 'EEprom not accessible',
-                    55: 'Not Toggled Service Mode',
-                    56: 'Can not send the command to internal micro',
-                    57: 'Command not Executed',
-                    58: 'The variable is not available, retry'
-                    }
+    TRANSMISSION = types.MappingProxyType({
+        0: 'Everything is OK',
+        51: 'Command is not implemented',
+        52: 'Variable does not exist',
+        53: 'Variable value is out of range',
+        54: 'EEprom not accessible',
+        55: 'Not Toggled Service Mode',
+        56: 'Can not send the command to internal micro',
+        57: 'Command not Executed',
+        58: 'The variable is not available, retry'
+    })
 
     # inverter system module state code maps
 
     # global state
-    GLOBAL = {0: 'Sending Parameters',
-              1: 'Wait Sun/Grid',
-              2: 'Checking Grid',
-              3: 'Measuring Riso',
-              4: 'DcDc Start',
-              5: 'Inverter Start',
-              6: 'Run',
-              7: 'Recovery',
-              8: 'Pause',
-              9: 'Ground Fault',
-              10: 'OTH Fault',
-              11: 'Address Setting',
-              12: 'Self Test',
-              13: 'Self Test Fail',
-              14: 'Sensor Test + Meas.Riso',
-              15: 'Leak Fault',
-              16: 'Waiting for manual reset ',
-              17: 'Internal Error E026',
-              18: 'Internal Error E027',
-              19: 'Internal Error E028',
-              20: 'Internal Error E029',
-              21: 'Internal Error E030',
-              22: 'Sending Wind Table',
-              23: 'Failed Sending table',
-              24: 'UTH Fault',
-              25: 'Remote OFF',
-              26: 'Interlock Fail',
-              27: 'Executing Autotest',
-              30: 'Waiting Sun',
-              31: 'Temperature Fault',
-              32: 'Fan Stacked',
-              33: 'Int. Com. Fault',
-              34: 'Slave Insertion',
-              35: 'DC Switch Open',
-              36: 'TRAS Switch Open',
-              37: 'MASTER Exclusion',
-              38: 'Auto Exclusion ',
-              98: 'Erasing Internal EEprom',
-              99: 'Erasing External EEprom',
-              100: 'Counting EEprom',
-              101: 'Freeze'
-              }
+    GLOBAL = types.MappingProxyType({
+        0: 'Sending Parameters',
+        1: 'Wait Sun/Grid',
+        2: 'Checking Grid',
+        3: 'Measuring Riso',
+        4: 'DcDc Start',
+        5: 'Inverter Start',
+        6: 'Run',
+        7: 'Recovery',
+        8: 'Pause',
+        9: 'Ground Fault',
+        10: 'OTH Fault',
+        11: 'Address Setting',
+        12: 'Self Test',
+        13: 'Self Test Fail',
+        14: 'Sensor Test + Meas.Riso',
+        15: 'Leak Fault',
+        16: 'Waiting for manual reset ',
+        17: 'Internal Error E026',
+        18: 'Internal Error E027',
+        19: 'Internal Error E028',
+        20: 'Internal Error E029',
+        21: 'Internal Error E030',
+        22: 'Sending Wind Table',
+        23: 'Failed Sending table',
+        24: 'UTH Fault',
+        25: 'Remote OFF',
+        26: 'Interlock Fail',
+        27: 'Executing Autotest',
+        30: 'Waiting Sun',
+        31: 'Temperature Fault',
+        32: 'Fan Stacked',
+        33: 'Int. Com. Fault',
+        34: 'Slave Insertion',
+        35: 'DC Switch Open',
+        36: 'TRAS Switch Open',
+        37: 'MASTER Exclusion',
+        38: 'Auto Exclusion ',
+        98: 'Erasing Internal EEprom',
+        99: 'Erasing External EEprom',
+        100: 'Counting EEprom',
+        101: 'Freeze'
+    })
 
     # inverter state
-    INVERTER = {0: 'Stand By',
-                1: 'Checking Grid',
-                2: 'Run',
-                3: 'Bulk OV',
-                4: 'Out OC',
-                5: 'IGBT Sat',
-                6: 'Bulk UV',
-                7: 'Degauss Error',
-                8: 'No Parameters',
-                9: 'Bulk Low',
-                10: 'Grid OV',
-                11: 'Communication Error',
-                12: 'Degaussing',
-                13: 'Starting',
-                14: 'Bulk Cap Fail',
-                15: 'Leak Fail',
-                16: 'DcDc Fail',
-                17: 'Ileak Sensor Fail',
-                18: 'SelfTest: relay inverter',
-                19: 'SelfTest: wait for sensor test',
-                20: 'SelfTest: test relay DcDc + sensor',
-                21: 'SelfTest: relay inverter fail',
-                22: 'SelfTest timeout fail',
-                23: 'SelfTest: relay DcDc fail',
-                24: 'Self Test 1',
-                25: 'Waiting self test start',
-                26: 'Dc Injection',
-                27: 'Self Test 2',
-                28: 'Self Test 3',
-                29: 'Self Test 4',
-                30: 'Internal Error',
-                31: 'Internal Error',
-                40: 'Forbidden State',
-                41: 'Input UC',
-                42: 'Zero Power',
-                43: 'Grid Not Present',
-                44: 'Waiting Start',
-                45: 'MPPT',
-                46: 'Grid Fail',
-                47: 'Input OC'
-                }
+    INVERTER = types.MappingProxyType({
+        0: 'Stand By',
+        1: 'Checking Grid',
+        2: 'Run',
+        3: 'Bulk OV',
+        4: 'Out OC',
+        5: 'IGBT Sat',
+        6: 'Bulk UV',
+        7: 'Degauss Error',
+        8: 'No Parameters',
+        9: 'Bulk Low',
+        10: 'Grid OV',
+        11: 'Communication Error',
+        12: 'Degaussing',
+        13: 'Starting',
+        14: 'Bulk Cap Fail',
+        15: 'Leak Fail',
+        16: 'DcDc Fail',
+        17: 'Ileak Sensor Fail',
+        18: 'SelfTest: relay inverter',
+        19: 'SelfTest: wait for sensor test',
+        20: 'SelfTest: test relay DcDc + sensor',
+        21: 'SelfTest: relay inverter fail',
+        22: 'SelfTest timeout fail',
+        23: 'SelfTest: relay DcDc fail',
+        24: 'Self Test 1',
+        25: 'Waiting self test start',
+        26: 'Dc Injection',
+        27: 'Self Test 2',
+        28: 'Self Test 3',
+        29: 'Self Test 4',
+        30: 'Internal Error',
+        31: 'Internal Error',
+        40: 'Forbidden State',
+        41: 'Input UC',
+        42: 'Zero Power',
+        43: 'Grid Not Present',
+        44: 'Waiting Start',
+        45: 'MPPT',
+        46: 'Grid Fail',
+        47: 'Input OC'
+    })
 
     # DC/DC channel states
-    DCDC = {0: 'DcDc OFF',
-            1: 'Ramp Start',
-            2: 'MPPT',
-            3: 'Not Used',
-            4: 'Input OC',
-            5: 'Input UV',
-            6: 'Input OV',
-            7: 'Input Low',
-            8: 'No Parameters',
-            9: 'Bulk OV',
-            10: 'Communication Error',
-            11: 'Ramp Fail',
-            12: 'Internal Error',
-            13: 'Input mode Error',
-            14: 'Ground Fault',
-            15: 'Inverter Fail',
-            16: 'DcDc IGBT Sat',
-            17: 'DcDc ILEAK Fail',
-            18: 'DcDc Grid Fail',
-            19: 'DcDc Comm Error'
-            }
-
-    # alarm states
-    ALARM = {0:  {'description': 'No Alarm',          'code': 'No alarm code'},
-             1:  {'description': 'Sun Low',           'code': 'W001'},
-             2:  {'description': 'Input OC',          'code': 'E001'},
-             3:  {'description': 'Input UV',          'code': 'W002'},
-             4:  {'description': 'Input OV',          'code': 'E002'},
-             5:  {'description': 'Sun Low',           'code': 'W001'},
-             6:  {'description': 'No Parameters',     'code': 'E003'},
-             7:  {'description': 'Bulk OV',           'code': 'E004'},
-             8:  {'description': 'Comm.Error',        'code': 'E005'},
-             9:  {'description': 'Output OC',         'code': 'E006'},
-             10: {'description': 'IGBT Sat',          'code': 'E007'},
-             11: {'description': 'Bulk UV',           'code': 'W011'},
-             12: {'description': 'Internal error',    'code': 'E009'},
-             13: {'description': 'Grid Fail',         'code': 'W003'},
-             14: {'description': 'Bulk Low',          'code': 'E010'},
-             15: {'description': 'Ramp Fail',         'code': 'E011'},
-             16: {'description': 'Dc/Dc Fail',        'code': 'E012'},
-             17: {'description': 'Wrong Mode',        'code': 'E013'},
-             18: {'description': 'Ground Fault',      'code': '---'},
-             19: {'description': 'Over Temp.',        'code': 'E014'},
-             20: {'description': 'Bulk Cap Fail',     'code': 'E015'},
-             21: {'description': 'Inverter Fail',     'code': 'E016'},
-             22: {'description': 'Start Timeout',     'code': 'E017'},
-             23: {'description': 'Ground Fault',      'code': 'E018'},
-             24: {'description': 'Degauss error',     'code': '---'},
-             25: {'description': 'Ileak sens.fail',   'code': 'E019'},
-             26: {'description': 'DcDc Fail',         'code': 'E012'},
-             27: {'description': 'Self Test Error 1', 'code': 'E020'},
-             28: {'description': 'Self Test Error 2', 'code': 'E021'},
-             29: {'description': 'Self Test Error 3', 'code': 'E019'},
-             30: {'description': 'Self Test Error 4', 'code': 'E022'},
-             31: {'description': 'DC inj error',      'code': 'E023'},
-             32: {'description': 'Grid OV',           'code': 'W004'},
-             33: {'description': 'Grid UV',           'code': 'W005'},
-             34: {'description': 'Grid OF',           'code': 'W006'},
-             35: {'description': 'Grid UF',           'code': 'W007'},
-             36: {'description': 'Z grid Hi',         'code': 'W008'},
-             37: {'description': 'Internal error',    'code': 'E024'},
-             38: {'description': 'Riso Low',          'code': 'E025'},
-             39: {'description': 'Vref Error',        'code': 'E026'},
-             40: {'description': 'Error Meas V',      'code': 'E027'},
-             41: {'description': 'Error Meas F',      'code': 'E028'},
-             42: {'description': 'Error Meas Z',      'code': 'E029'},
-             43: {'description': 'Error Meas Ileak',  'code': 'E030'},
-             44: {'description': 'Error Read V',      'code': 'E031'},
-             45: {'description': 'Error Read I',      'code': 'E032'},
-             46: {'description': 'Table fail',        'code': 'W009'},
-             47: {'description': 'Fan Fail',          'code': 'W010'},
-             48: {'description': 'UTH',               'code': 'E033'},
-             49: {'description': 'Interlock fail',    'code': 'E034'},
-             50: {'description': 'Remote Off',        'code': 'E035'},
-             51: {'description': 'Vout Avg error',    'code': 'E036'},
-             52: {'description': 'Battery low',       'code': 'W012'},
-             53: {'description': 'Clk fail',          'code': 'W013'},
-             54: {'description': 'Input UC',          'code': 'E037'},
-             55: {'description': 'Zero Power',        'code': 'W014'},
-             56: {'description': 'Fan Stuck',         'code': 'E038'},
-             57: {'description': 'DC Switch Open',    'code': 'E039'},
-             58: {'description': 'Tras Switch Open',  'code': 'E040'},
-             59: {'description': 'AC Switch Open',    'code': 'E041'},
-             60: {'description': 'Bulk UV',           'code': 'E042'},
-             61: {'description': 'Autoexclusion',     'code': 'E043'},
-             62: {'description': 'Grid df/dt',        'code': 'W015'},
-             63: {'description': 'Den switch Open',   'code': 'W016'},
-             64: {'description': 'Jbox fail',         'code': 'W017'}
-             }
+    DCDC = types.MappingProxyType({
+        0: 'DcDc OFF',
+        1: 'Ramp Start',
+        2: 'MPPT',
+        3: 'Not Used',
+        4: 'Input OC',
+        5: 'Input UV',
+        6: 'Input OV',
+        7: 'Input Low',
+        8: 'No Parameters',
+        9: 'Bulk OV',
+        10: 'Communication Error',
+        11: 'Ramp Fail',
+        12: 'Internal Error',
+        13: 'Input mode Error',
+        14: 'Ground Fault',
+        15: 'Inverter Fail',
+        16: 'DcDc IGBT Sat',
+        17: 'DcDc ILEAK Fail',
+        18: 'DcDc Grid Fail',
+        19: 'DcDc Comm Error'
+    })
+
+    # Alarm states. Alarm codes are contiguous (0..64) so a tuple indexed
+    # directly by alarm code replaces the old dict-of-dicts, each entry is
+    # a (description, code) tuple.
+    ALARM = (
+        ('No Alarm',          'No alarm code'),
+        ('Sun Low',           'W001'),
+        ('Input OC',          'E001'),
+        ('Input UV',          'W002'),
+        ('Input OV',          'E002'),
+        ('Sun Low',           'W001'),
+        ('No Parameters',     'E003'),
+        ('Bulk OV',           'E004'),
+        ('Comm.Error',        'E005'),
+        ('Output OC',         'E006'),
+        ('IGBT Sat',          'E007'),
+        ('Bulk UV',           'W011'),
+        ('Internal error',    'E009'),
+        ('Grid Fail',         'W003'),
+        ('Bulk Low',          'E010'),
+        ('Ramp Fail',         'E011'),
+        ('Dc/Dc Fail',        'E012'),
+        ('Wrong Mode',        'E013'),
+        ('Ground Fault',      '---'),
+        ('Over Temp.',        'E014'),
+        ('Bulk Cap Fail',     'E015'),
+        ('Inverter Fail',     'E016'),
+        ('Start Timeout',     'E017'),
+        ('Ground Fault',      'E018'),
+        ('Degauss error',     '---'),
+        ('Ileak sens.fail',   'E019'),
+        ('DcDc Fail',         'E012'),
+        ('Self Test Error 1', 'E020'),
+        ('Self Test Error 2', 'E021'),
+        ('Self Test Error 3', 'E019'),
+        ('Self Test Error 4', 'E022'),
+        ('DC inj error',      'E023'),
+        ('Grid OV',           'W004'),
+        ('Grid UV',           'W005'),
+        ('Grid OF',           'W006'),
+        ('Grid UF',           'W007'),
+        ('Z grid Hi',         'W008'),
+        ('Internal error',    'E024'),
+        ('Riso Low',          'E025'),
+        ('Vref Error',        'E026'),
+        ('Error Meas V',      'E027'),
+        ('Error Meas F',      'E028'),
+        ('Error Meas Z',      'E029'),
+        ('Error Meas Ileak',  'E030'),
+        ('Error Read V',      'E031'),
+        ('Error Read I',      'E032'),
+        ('Table fail',        'W009'),
+        ('Fan Fail',          'W010'),
+        ('UTH',               'E033'),
+        ('Interlock fail',    'E034'),
+        ('Remote Off',        'E035'),
+        ('Vout Avg error',    'E036'),
+        ('Battery low',       'W012'),
+        ('Clk fail',          'W013'),
+        ('Input UC',          'E037'),
+        ('Zero Power',        'W014'),
+        ('Fan Stuck',         'E038'),
+        ('DC Switch Open',    'E039'),
+        ('Tras Switch Open',  'E040'),
+        ('AC Switch Open',    'E041'),
+        ('Bulk UV',           'E042'),
+        ('Autoexclusion',     'E043'),
+        ('Grid df/dt',        'W015'),
+        ('Den switch Open',   'W016'),
+        ('Jbox fail',         'W017'),
+    )
 
     def __init__(self, port, baudrate=DEFAULT_BAUDRATE, address=DEFAULT_ADDRESS,
                  read_timeout=DEFAULT_READ_TIMEOUT, write_timeout=DEFAULT_WRITE_TIMEOUT,
@@ -899,6 +1147,16 @@ class AuroraInverter(object):
         self.wait_before_retry = wait_before_retry
         self.command_delay = command_delay
         self.max_tries = max_tries
+        # Deadline before which the next command must not be sent. The
+        # inverter requires a short turnaround delay (command_delay) between
+        # consecutive commands; rather than sleeping unconditionally after
+        # each write we record a deadline and sleep only for any portion of
+        # the delay not already consumed by other work (eg decoding the
+        # previous response).
+        self._next_write_ts = 0.0
+        # Lock serialising transactions on the half-duplex port, the poller
+        # thread and the WeeWX engine thread (time sync) both issue commands.
+        self._port_lock = threading.Lock()
 
         # Inverter commands that I know about. Each entry contains the command
         # code to be sent to the inverter as well as the decode function to
@@ -959,11 +1217,31 @@ class AuroraInverter(object):
             'partial_energy':             {'cmd': 'cumulated_energy', 'payload': b'\x06'},
             'last_alarms':                {'cmd': 'last_alarms'}
         }
+        # Flattened form of field_commands mapping field name directly to a
+        # (command, payload) tuple. get_field() uses this so resolving a
+        # field costs a single dict lookup rather than a dict lookup, a
+        # subscript and a get() per call.
+        self._field_commands_resolved = {_field: (_entry['cmd'], _entry.get('payload'))
+                                         for _field, _entry in self.field_commands.items()}
+        # Cache of fully constructed command messages (including CRC) keyed
+        # by (command, payload). All field commands use fixed payloads so
+        # their message bytes can be constructed once and reused for every
+        # poll, this means no message construction or CRC calculation is
+        # required on the send side at poll time.
+        self._msg_cache = {}
+        for field_dict in self.field_commands.values():
+            _key = (field_dict['cmd'], field_dict.get('payload'))
+            if _key not in self._msg_cache:
+                _cmd_code = self.commands[_key[0]]['cmd_code']
+                self._msg_cache[_key] = self.construct_cmd_message(_cmd_code,
+                                                                   _key[1])
         # initialise transmission state and global state properties
         self.transmission_state = None
         self.global_state = None
         # open the port to the inverter
         self.serial_port = None
+        self._raw_write = None
+        self._raw_read = None
         self.open_port()
         # Attempt to obtain the inverter state so that we can update the
         # transmission state and global state properties. If the inverter is
@@ -991,6 +1269,8 @@ class AuroraInverter(object):
     def open_port(self):
         """Open a serial port."""
 
+        # make sure pyserial has been imported, it is imported on first use
+        _ensure_serial()
         try:
             self.serial_port = serial.Serial(port=self.port,
                                              baudrate=self.baudrate,
@@ -1003,12 +1283,45 @@ class AuroraInverter(object):
             # re-raise as a WeeWX IO error
             raise
         else:
+            # If we can, enable low latency mode on the port. USB-serial
+            # adapters typically coalesce received bytes for ~16ms before
+            # passing them up, far longer than the inverter takes to send a
+            # response at 19200 baud. Low latency mode drops the timer to
+            # ~1ms. Not all platforms/adapters support it so failure is not
+            # an error.
+            try:
+                self.serial_port.set_low_latency_mode(True)
+            except (AttributeError, NotImplementedError, ValueError, OSError):
+                log.debug("Low latency mode is not supported on this port")
+            # cache the port's bound write and read methods, write()/read()
+            # use these every transaction and the cached bound method saves
+            # an attribute-chain walk per call
+            self._raw_write = self.serial_port.write
+            self._raw_read = self.serial_port.read
             log.debug("Opened serial port '%s' baudrate: %d read_timeout: %.2f write_timeout: %.2f",
                       self.port,
                       self.baudrate,
                       self.read_timeout,
                       self.write_timeout)
 
+    def soft_reset_port(self):
+        """Discard any buffered serial data without cycling the port.
+
+        Flushing the kernel input and output buffers is often enough to
+        recover from a transient framing/CRC glitch and, unlike a full
+        close/open cycle of a USB-serial port, takes effectively no time.
+        """
+
+        try:
+            self.serial_port.reset_input_buffer()
+            self.serial_port.reset_output_buffer()
+        except serial.SerialException as e:
+            # we encountered a serial exception, log it and re-raise as a
+            # WeeWX IO error
+            log.error("SerialException on buffer reset.")
+            log.error("  ***** %s", e)
+            raise weewx.WeeWxIOError(e)
+
     def close_port(self):
         """Close a serial port."""
 
@@ -1018,6 +1331,10 @@ class AuroraInverter(object):
         except weewx.WeeWxIOError:
             pass
         self.serial_port.close()
+        # The cached bound methods are left in place; like serial_port
+        # itself they now refer to a closed port and any use raises a
+        # SerialException that write()/read() already handle. They are
+        # rebound if the port is re-opened.
 
     def write(self, data):
         """Send data to the inverter.
@@ -1031,7 +1348,7 @@ class AuroraInverter(object):
         """
 
         try:
-            n = self.serial_port.write(data)
+            n = self._raw_write(data)
         except serial.SerialTimeoutException as e:
             # we encountered a write timeout, log it and re-raise as a WeeWX IO
             # error
@@ -1046,12 +1363,11 @@ class AuroraInverter(object):
             log.error("  ***** %s", e)
             # re-raise as a WeeWX error I/O error:
             raise weewx.WeeWxIOError(e)
-        # Check the serial.Serial.write() return value. write() always returns
-        # 'None' for pyserial version 2.5 and earlier, so if we received 'None'
-        # it may have been a successful write. We can only infer an error if we
-        # received a non-None value and it does not match the number of bytes
-        # we intended to send.
-        if n is not None and n != len(data):
+        # Check the serial.Serial.write() return value. pyserial 3.x (the
+        # floor for any WeeWX v5 install) always returns the number of bytes
+        # written, so anything other than the length of the data sent is an
+        # error.
+        if n != len(data):
             raise weewx.WeeWxIOError("Expected to write %d chars; sent %d instead" % (len(data),
                                                                                       n))
 
@@ -1070,7 +1386,7 @@ class AuroraInverter(object):
         """
 
         try:
-            _buffer = self.serial_port.read(bytes_to_read)
+            _buffer = self._raw_read(bytes_to_read)
         except serial.SerialTimeoutException as e:
             # we encountered a read timeout, log it and re-raise as a WeeWX IO
             # error
@@ -1100,10 +1416,88 @@ class AuroraInverter(object):
         exception.
         """
 
-        response_t = self.execute_cmd_with_crc(command=self.field_commands[field_name]['cmd'],
-                                               payload=self.field_commands[field_name].get('payload'))
+        _cmd, _payload = self._field_commands_resolved[field_name]
+        response_t = self.execute_cmd_with_crc(command=_cmd, payload=_payload)
         return response_t.data
 
+    def get_fields(self, field_names):
+        """Obtain the values of a number of fields using the API.
+
+        The Aurora protocol has no multi-register command, each field is a
+        separate request/response exchange, but obtaining a batch of fields
+        in a single call keeps the whole retrieval loop inside the inverter
+        object where the per-field bookkeeping is cheapest and gives the
+        driver a single call per poll.
+
+        Fields that cannot be obtained are omitted from the result. If the
+        inverter stops running (eg it has gone to sleep) the remaining
+        fields are abandoned, there is no point issuing commands to an
+        inverter that will not answer them.
+
+        Input:
+            field_names: An iterable of field names to be obtained, each
+                         must be a key to the field_commands dict.
+
+        Returns:
+            A dict of field values keyed by field name.
+        """
+
+        # if the inverter is not running there is no point issuing any
+        # commands at all
+        if not self.is_running:
+            return {}
+        data = {}
+        # bind the bound method once rather than re-resolving the attribute
+        # on every pass through the loop
+        _get_field = self.get_field
+        for field_name in field_names:
+            # get the field value, be prepared to catch a weewx.WeeWxIOError
+            # if the field cannot be obtained from the inverter
+            try:
+                data[field_name] = _get_field(field_name)
+            except weewx.WeeWxIOError:
+                # We could not get the field. If the inverter is no longer
+                # running (it has gone to sleep mid-batch) abandon the
+                # remaining fields, they will fail the same way; otherwise
+                # ignore the exception and move on to the next field.
+                if not self.is_running:
+                    break
+                continue
+        return data
+
+    def _transact(self, message, bytes_to_read=8):
+        """Send a command message and read the CRC checked response.
+
+        A single request/response transaction with the inverter. Respects
+        the inverter turnaround delay by sleeping only for any part of
+        command_delay not already consumed since the last write, flushes
+        the message out of the kernel buffer so transmission starts
+        immediately, then blocks on the serial port read timeout until
+        the response arrives.
+
+        Input:
+            message: the complete command message including CRC. Bytestring.
+            bytes_to_read: the expected response length in bytes.
+
+        Returns:
+            The response payload with the CRC verified and stripped.
+        """
+
+        _remaining = self._next_write_ts - time.monotonic()
+        if _remaining > 0:
+            time.sleep(_remaining)
+        self.write(message)
+        try:
+            self.serial_port.flush()
+        except serial.SerialException as e:
+            # we encountered a serial exception, log it and re-raise as a
+            # WeeWX IO error
+            log.error("SerialException on flush.")
+            log.error("  ***** %s", e)
+            raise weewx.WeeWxIOError(e)
+        self._next_write_ts = time.monotonic() + self.command_delay
+        return self.read_with_crc(bytes_to_read)
+
     def execute_cmd_with_crc(self, command, payload=None):
         """Send a command with CRC to the inverter and return the decoded
         response.
@@ -1126,101 +1520,132 @@ class AuroraInverter(object):
             The decoded inverter response to the command as a Response Tuple.
         """
 
-        # get the command message to be sent including CRC
-        _command_bytes_crc = self.construct_cmd_message(command_code=self.commands[command]['cmd_code'],
-                                                        payload=payload)
-        # now send the assembled command retrying up to max_tries times
-        for count in range(self.max_tries):
-            if weewx.debug >= 2:
-                log.debug("execute_cmd_with_crc: sent %d",
-                          format_byte_to_hex(_command_bytes_crc))
-            try:
-                self.write(_command_bytes_crc)
-                # wait before reading
-                time.sleep(self.command_delay)
-                # look for the response
-                _resp = self.read_with_crc()
-            except weewx.CRCError:
-                # We seem to get occasional CRC errors, once they start they
-                # continue indefinitely. Closing then opening the serial port
-                # seems to reset the error and allow proper communication to
-                # continue (until the next one). So if we get a CRC error then
-                # cycle the port and continue.
-
-                if count < self.max_tries - 1:
-                    # log that we are about to cycle the port
-                    log.info("CRC error on try #%d. Cycling port.", count + 1)
-                    # close the port, wait 0.2 sec then open the port
-                    self.close_port()
-                    time.sleep(0.2)
-                    self.open_port()
-                    # log that the port has been cycled
-                    log.info("Port cycle complete.")
-                else:
-                    log.info("CRC error on try #%d.", count + 1)
-            except weewx.WeeWxIOError as e:
-                # Sometimes we seem to get stuck with continuous IO errors.
-                # Cycling the serial port after the second IO error or (one try
-                # before the max_tries limit) usually fixes the problem.
-                if count < self.max_tries - 1:
-                    # this is not our last attempt
-                    if count >= 1 or self.max_tries < 3:
-                        # it's either our second attempt or our first attempt
-                        # if max_tries < 3 so cycle the port
-                        if weewx.debug >= 2:
-                            log.debug("%s: attempt #%d unsuccessful... cycling port",
-                                      "execute_cmd_with_crc",
-                                      count + 1)
-                        # to cycle the port close the port, wait 0.2 sec then
-                        # open the port
-                        self.close_port()
-                        time.sleep(0.2)
-                        self.open_port()
-                        # log that the port has been cycled
-                        if weewx.debug >= 2:
-                            log.debug("execute_cmd_with_crc: port cycle complete.")
+        # look up the command entry once, it is used for the command code
+        # and the decode function
+        _cmd_dict = self.commands[command]
+        # Obtain the command message to be sent including CRC. Almost all
+        # commands use a fixed payload so the pre-constructed message from
+        # the message cache can be used, otherwise (eg 'set_time_date')
+        # construct the message from scratch.
+        _command_bytes_crc = self._msg_cache.get((command, payload))
+        if _command_bytes_crc is None:
+            _command_bytes_crc = self.construct_cmd_message(command_code=_cmd_dict['cmd_code'],
+                                                            payload=payload)
+        # Resolve the debug gate and the decode function to locals once, the
+        # retry loop would otherwise re-test/re-resolve them on every
+        # attempt. The heavy lifting of the I/O itself is already a straight
+        # write-sleep-read line in _transact().
+        _debug2 = weewx.debug >= 2
+        _decode_fn = _cmd_dict['decode_fn']
+        # Serialise access to the half-duplex port. The poller thread owns
+        # routine polling but time sync arrives on the WeeWX engine thread
+        # via getTime()/setTime(); without the lock a command from one
+        # thread could interleave with an in-flight transaction from the
+        # other and a valid-CRC response would be attributed to the wrong
+        # command. The lock also covers the port-cycle recovery below so
+        # one thread cannot cycle the port under the other mid-read.
+        with self._port_lock:
+            # now send the assembled command retrying up to max_tries times
+            for count in range(self.max_tries):
+                if _debug2:
+                    log.debug("execute_cmd_with_crc: sent %s",
+                              format_byte_to_hex(_command_bytes_crc))
+                try:
+                    # send the command and obtain the CRC checked response, the
+                    # turnaround delay and read blocking are handled by
+                    # _transact()
+                    _resp = self._transact(_command_bytes_crc)
+                except weewx.CRCError:
+                    # We seem to get occasional CRC errors, once they start they
+                    # continue indefinitely. Closing then opening the serial port
+                    # seems to reset the error and allow proper communication to
+                    # continue (until the next one). However, cycling a USB-serial
+                    # port is slow (can be hundreds of milliseconds), so on the
+                    # first CRC error just discard the kernel serial buffers and
+                    # retry; this clears most transient glitches at almost no
+                    # cost. Only if CRC errors persist do a full port cycle.
+
+                    if count < self.max_tries - 1:
+                        if count == 0:
+                            # first CRC error, try a cheap buffer flush first
+                            log.info("CRC error on try #%d. Flushing serial buffers.",
+                                     count + 1)
+                            self.soft_reset_port()
+                            time.sleep(0.05)
+                        else:
+                            # log that we are about to cycle the port
+                            log.info("CRC error on try #%d. Cycling port.", count + 1)
+                            # close the port, wait 0.2 sec then open the port
+                            self.close_port()
+                            time.sleep(0.2)
+                            self.open_port()
+                            # log that the port has been cycled
+                            log.info("Port cycle complete.")
                     else:
-                        # it must be our first attempt, so log the failure and
-                        # have a short sleep until the next attempt
-                        if weewx.debug >= 2:
-                            log.debug("%s: try #%d unsuccessful... sleeping",
-                                      "execute_cmd_with_crc",
+                        log.info("CRC error on try #%d.", count + 1)
+                except weewx.WeeWxIOError as e:
+                    # Sometimes we seem to get stuck with continuous IO errors.
+                    # Cycling the serial port after the second IO error or (one try
+                    # before the max_tries limit) usually fixes the problem.
+                    if count < self.max_tries - 1:
+                        # this is not our last attempt
+                        if count >= 1 or self.max_tries < 3:
+                            # it's either our second attempt or our first attempt
+                            # if max_tries < 3 so cycle the port
+                            if _debug2:
+                                log.debug("%s: attempt #%d unsuccessful... cycling port",
+                                          "execute_cmd_with_crc",
+                                          count + 1)
+                            # to cycle the port close the port, wait 0.2 sec then
+                            # open the port
+                            self.close_port()
+                            time.sleep(0.2)
+                            self.open_port()
+                            # log that the port has been cycled
+                            if _debug2:
+                                log.debug("execute_cmd_with_crc: port cycle complete.")
+                        else:
+                            # it must be our first attempt, so log the failure and
+                            # have a short sleep until the next attempt
+                            if _debug2:
+                                log.debug("%s: try #%d unsuccessful... sleeping",
+                                          "execute_cmd_with_crc",
+                                          count + 1)
+                            time.sleep(self.wait_before_retry)
+                        # we are going to have another attempt, so log it
+                        if _debug2:
+                            log.debug("execute_cmd_with_crc: retrying")
+                    else:
+                        # this was our last attempt, so log it as unsuccessful
+                        if _debug2:
+                            log.debug("execute_cmd_with_crc: try #%d unsuccessful",
                                       count + 1)
-                        time.sleep(self.wait_before_retry)
-                    # we are going to have another attempt, so log it
-                    if weewx.debug >= 2:
-                        log.debug("execute_cmd_with_crc: retrying")
-                else:
-                    # this was our last attempt, so log it as unsuccessful
-                    if weewx.debug >= 2:
-                        log.debug("execute_cmd_with_crc: try #%d unsuccessful",
-                                  count + 1)
-            else:
-                # We have a response that has passed the CRC check, now decode
-                # it. Wrap in a try .. except in case there is a problem
-                # decoding the response
-                try:
-                    _response_t = self.commands[command]['decode_fn'](_resp)
-                except (IndexError, TypeError):
-                    # for some reason the data could not be decoded, log it but
-                    # at a higher debug level
-                    if weewx.debug >= 2:
-                        log.debug("%s: '%s' could not decode response '%s'",
-                                  "execute_cmd_with_crc",
-                                  self.commands[command]['decode_fn'].__name__,
-                                  format_byte_to_hex(_resp))
-                    # return a 'None' ResponseTuple
-                    return ResponseTuple(None, None, None)
                 else:
-                    # we received a valid, decoded response
-                    # update the global_state and transmission_state properties
-                    # from the response if they are not None
-                    if _response_t.transmission_state is not None:
-                        self.transmission_state = _response_t.transmission_state
-                    if _response_t.global_state is not None:
-                        self.global_state = _response_t.global_state
-                    # finally return the ResponseTuple
-                    return _response_t
+                    # We have a response that has passed the CRC check, now decode
+                    # it. Wrap in a try .. except in case there is a problem
+                    # decoding the response
+                    try:
+                        _response_t = _decode_fn(_resp)
+                    except (IndexError, TypeError):
+                        # for some reason the data could not be decoded, log it but
+                        # at a higher debug level
+                        if _debug2:
+                            log.debug("%s: '%s' could not decode response '%s'",
+                                      "execute_cmd_with_crc",
+                                      _decode_fn.__name__,
+                                      format_byte_to_hex(_resp))
+                        # return a 'None' ResponseTuple
+                        return ResponseTuple(None, None, None)
+                    else:
+                        # we received a valid, decoded response
+                        # update the global_state and transmission_state properties
+                        # from the response if they are not None
+                        if _response_t.transmission_state is not None:
+                            self.transmission_state = _response_t.transmission_state
+                        if _response_t.global_state is not None:
+                            self.global_state = _response_t.global_state
+                        # finally return the ResponseTuple
+                        return _response_t
         # if we made it here we have exhausted our attempts to obtain data from
         # the inverter, log it and raise a WeeWxIOError
         log.debug("Unable to send or receive data to/from the inverter")
@@ -1252,45 +1677,19 @@ class AuroraInverter(object):
     def crc16(buf):
         """Calculate a CCITT CRC16 checksum of a series of bytes.
 
-        Calculated as per the Checksum calculation section of the Aurora PV
-        Inverter Series Communications Protocol.
-
-        Use struct module to convert the input string to a sequence of bytes.
-        Could use bytearray but that was not introduced until python 2.6.
+        The CRC calculation itself is performed by the module level crc16()
+        function, this method is retained as a convenience for existing users
+        of the AuroraInverter API.
 
         Input:
-            buf: string of binary packed data for which the CRC is to be
-                 calculated
+            buf: bytes or bytearray of binary packed data for which the CRC
+                 is to be calculated
 
         Returns:
-            A two byte string containing the CRC.
+            The CRC as a two byte integer.
         """
 
-        poly = 0x8408
-        crc = 0xffff
-
-        # if our input is nothing then that is simple
-        if len(buf) == 0:
-            return ~crc & 0xffff
-
-        # Get a Struct object so we can unpack our input string. Our input
-        # could be of any length so construct our Struct format string based on
-        # the length of the input string.
-        _format = ''.join(['B' for _b in range(len(buf))])
-        s = struct.Struct(_format)
-        # unpack the input string into our sequence of bytes
-        _bytes = s.unpack(buf)
-
-        # now calculate the CRC of our sequence of bytes
-        for _byte in _bytes:
-            for i in range(8):
-                if (crc & 0x0001) ^ (_byte & 0x0001):
-                    crc = ((crc >> 1) ^ poly) & 0xffff
-                else:
-                    crc >>= 1
-                _byte >>= 1
-
-        return ~crc & 0xffff
+        return crc16(buf)
 
     @staticmethod
     def strip_crc16(buffer):
@@ -1301,41 +1700,44 @@ class AuroraInverter(object):
             buffer:
 
         Returns:
-             a bytearray"""
+             a bytes object containing the data payload"""
 
-        # get the data payload
+        # get the data payload, the slice is already a new bytes object so
+        # there is no need to copy it into a bytearray before returning it
         data = buffer[:-2]
-        # get the CRC bytes
-        crc_bytes = buffer[-2:]
+        # obtain the received CRC as an integer, the CRC is transmitted low
+        # byte first
+        resp_crc = buffer[-2] | (buffer[-1] << 8)
         # calculate the CRC of the received data
-        crc = AuroraInverter.word2struct(AuroraInverter.crc16(data))
+        crc = crc16(data)
         # if our calculated CRC == received CRC then our data is valid and
-        # return it, otherwise raise a CRCError
-        if crc == crc_bytes:
-            return bytearray(data)
+        # return it, otherwise raise a CRCError. Comparing the CRCs as
+        # integers saves packing our calculated CRC into a bytestring just
+        # for the comparison.
+        if crc == resp_crc:
+            return data
         else:
             log.error("Inverter response failed CRC check:")
             log.error("  ***** response=%s", format_byte_to_hex(buffer))
             log.error("  *****     data=%s        CRC=%s  expected CRC=%s",
                       format_byte_to_hex(data),
-                      format_byte_to_hex(crc_bytes),
-                      format_byte_to_hex(crc))
+                      format_byte_to_hex(buffer[-2:]),
+                      format_byte_to_hex(AuroraInverter.word2struct(crc)))
             raise weewx.CRCError("Inverter response failed CRC check")
 
     @staticmethod
     def word2struct(i):
-        """Take a 2 byte word and reverse the byte order.
+        """Convert a 2 byte word to a little-endian bytestring.
 
         Input:
-            i: A 2 byte string containing the bytes to be processed.
+            i: An integer containing the 2 byte word to be processed.
 
         Returns:
-            A 2 byte string consisting of the input bytes but in reverse order.
+            A 2 byte bytestring containing the low byte then the high byte
+            of the input word.
         """
 
-        s = struct.Struct('2B')
-        b = s.pack(i & 0xff, i // 256)
-        return b
+        return i.to_bytes(2, 'little')
 
     def construct_cmd_message(self, command_code, payload=None):
         """Construct the byte sequence for a command.
@@ -1366,36 +1768,35 @@ class AuroraInverter(object):
                           command. Will occupy part or all of bytes 2, 3, 4, 5,
                           6 and 7. Optional, bytestring.
 
-        The command sequence bytestring is constructed by creating a tuple of
-        bytes from the command parameters. The tuple is padded with '0's to
-        give a length of 10 elements. The tuple is converted to a bytestring,
-        its CRC16 calculated and appended to the bytestring to give the final
-        command sequence.
+        The command message is assembled in a pre-allocated 10 byte buffer;
+        a bytearray is created zero-filled so the padding of unused bytes
+        with 0x00 comes for free and no intermediate bytestring
+        concatenations are needed.
 
         Returns:
             A bytes object (aka bytestring) 10 bytes in length containing the
             command message.
         """
 
-        # First construct a tuple of the bytes we are to send, starting with byte 0,
-        # ending with byte 9. Then convert to a bytestring,  and then convert the tup
-
+        # pre-allocate the full 10 byte message, a new bytearray is
+        # zero-filled so the padding bytes are already in place
+        _buffer = bytearray(10)
         # all command sequences start with the inverter address and command
-        # code, this is the start of our command sequence tuple
-        _command_b_str = struct.pack('2B', self.address, command_code)
-        # the rest of the command sequence tuple depends on what we have been
-        # asked to send
-
+        # code
+        _buffer[0] = self.address
+        _buffer[1] = command_code
         # do we have a payload?
         if payload is not None:
-            # as the payload is a bytestring we can simply add it to the
-            # command sequence bytestring
-            _command_b_str += payload
-        # now pad out the command sequence with 0s until it's length is 8
-        # (10 bytes - 2 bytes for CRC)
-        _command_b_str += b'\x00' * (8 - len(_command_b_str))
-        # add the CRC and return our byte sequence
-        return _command_b_str + self.word2struct(self.crc16(_command_b_str))
+            # as the payload is a bytestring we can splice it straight into
+            # the buffer after the command code
+            _buffer[2:2 + len(payload)] = payload
+        # calculate the CRC over the first 8 bytes and place it in the last
+        # two bytes, low byte first
+        _crc = crc16(bytes(_buffer[:8]))
+        _buffer[8] = _crc & 0xff
+        _buffer[9] = _crc >> 8
+        # return the message as an immutable bytestring
+        return bytes(_buffer)
 
     def get_state(self):
         """Get the inverter state.
@@ -1450,9 +1851,9 @@ class AuroraInverter(object):
         # the inverters epoch is midnight 1 January 2000 so offset our epoch
         # timestamp accordingly
         _inverter_ts = epoch_ts - 946648800
-        # pack the value into a Struct object so we can get the offset
-        # timestamp as a bytestring, this will be our payload for set_time_date
-        _inverter_ts_b_str = struct.pack('>i', _inverter_ts)
+        # pack the offset timestamp into a bytestring using the pre-compiled
+        # Struct object, this will be our payload for set_time_date
+        _inverter_ts_b_str = _INT32_STRUCT.pack(_inverter_ts)
         try:
             response_t = self.execute_cmd_with_crc('set_time_date',
                                                    payload=_inverter_ts_b_str)
@@ -1569,8 +1970,7 @@ class AuroraInverter(object):
         """
 
         try:
-            return ResponseTuple(int(v[0]), int(v[1]),
-                                 (int(v[2]), int(v[3]), int(v[4]), int(v[5])))
+            return ResponseTuple(v[0], v[1], tuple(v[2:6]))
         except (IndexError, TypeError):
             return ResponseTuple(None, None, None)
 
@@ -1596,7 +1996,7 @@ class AuroraInverter(object):
         """
 
         try:
-            return ResponseTuple(None, None, str(v.decode()))
+            return ResponseTuple(None, None, v.decode())
         except (IndexError, TypeError):
             return ResponseTuple(None, None, None)
 
@@ -1626,7 +2026,7 @@ class AuroraInverter(object):
         """
 
         try:
-            return ResponseTuple(int(v[0]), int(v[1]), str(v[2:6].decode()))
+            return ResponseTuple(v[0], v[1], v[2:6].decode())
         except (IndexError, TypeError):
             return ResponseTuple(None, None, None)
 
@@ -1669,8 +2069,8 @@ class AuroraInverter(object):
         """
 
         try:
-            return ResponseTuple(int(v[0]), int(v[1]),
-                                 struct.unpack('!f', v[2:])[0])
+            return ResponseTuple(v[0], v[1],
+                                 _FLOAT_STRUCT.unpack_from(v, 2)[0])
         except (IndexError, TypeError):
             return ResponseTuple(None, None, None)
 
@@ -1701,9 +2101,8 @@ class AuroraInverter(object):
         """
 
         try:
-            return ResponseTuple(int(v[0]),
-                                 int(v[1]),
-                                 (int(str(v[2:4].decode())), int(str(v[4:6].decode()))))
+            return ResponseTuple(v[0], v[1],
+                                 (int(v[2:4].decode()), int(v[4:6].decode())))
         except (IndexError, TypeError):
             return ResponseTuple(None, None, None)
 
@@ -1741,7 +2140,7 @@ class AuroraInverter(object):
         """
 
         try:
-            return ResponseTuple(int(v[0]), int(v[1]),
+            return ResponseTuple(v[0], v[1],
                                  AuroraInverter._dec_int(v).data + 946648800)
         except (IndexError, TypeError):
             return ResponseTuple(None, None, None)
@@ -1775,9 +2174,7 @@ class AuroraInverter(object):
         """
 
         try:
-            s = struct.Struct('>I')
-            _int = s.unpack(v[2:6])[0]
-            return ResponseTuple(int(v[0]), int(v[1]), _int)
+            return ResponseTuple(v[0], v[1], int.from_bytes(v[2:6], 'big'))
         except (IndexError, TypeError):
             return ResponseTuple(None, None, None)
 
@@ -1826,8 +2223,7 @@ class AuroraInverter(object):
         """
 
         try:
-            _alarms = tuple([int(a) for a in v[2:6]])
-            return ResponseTuple(int(v[0]), int(v[1]), _alarms)
+            return ResponseTuple(v[0], v[1], tuple(v[2:6]))
         except (IndexError, TypeError):
             return ResponseTuple(None, None, None)
 
@@ -1859,12 +2255,9 @@ class AuroraConfigurator(weewx.drivers.AbstractConfigurator):
 
         return "Configuration utility for an Aurora inverter."
 
-    @property
-    def usage(self):
-        """weectl device usage information."""
-
-        return f"""{bcolors.BOLD}%prog --help
-       %prog --version 
+    # weectl device usage banner, built once at class definition time
+    _USAGE = f"""{bcolors.BOLD}%prog --help
+       %prog --version
        %prog --gen-packets [FILENAME|--config=FILENAME]
        %prog --live-data [FILENAME|--config=FILENAME]
        %prog --status [FILENAME|--config=FILENAME]
@@ -1872,6 +2265,12 @@ class AuroraConfigurator(weewx.drivers.AbstractConfigurator):
        %prog --get-time [FILENAME|--config=FILENAME]
        %prog --set-time [FILENAME|--config=FILENAME]{bcolors.ENDC}"""
 
+    @property
+    def usage(self):
+        """weectl device usage information."""
+
+        return AuroraConfigurator._USAGE
+
     @property
     def epilog(self):
         """Epilog displayed as part of weectl device help information."""
@@ -2008,6 +2407,93 @@ class AuroraConfEditor(weewx.drivers.AbstractConfEditor):
 #                             Utility functions
 # ============================================================================
 
+def _crc16(buf):
+    """Calculate a CCITT CRC16 checksum of a series of bytes.
+
+    Calculated as per the Checksum calculation section of the Aurora PV
+    Inverter Series Communications Protocol.
+
+    The calculation is deliberately limited to primitive types only (a byte
+    sequence in and an int out) so that, if available, numba can be used to
+    JIT compile the function. If numba is not available the function is used
+    as is.
+
+    Input:
+        buf: bytes or bytearray of binary packed data for which the CRC is
+             to be calculated
+
+    Returns:
+        The CRC as a two byte integer.
+    """
+
+    poly = 0x8408
+    crc = 0xffff
+
+    # now calculate the CRC of our sequence of bytes, iterating a bytes or
+    # bytearray object yields each byte as an int
+    for _byte in buf:
+        for i in range(8):
+            if (crc & 0x0001) ^ (_byte & 0x0001):
+                crc = ((crc >> 1) ^ poly) & 0xffff
+            else:
+                crc >>= 1
+            _byte >>= 1
+
+    return ~crc & 0xffff
+
+
+# Table of bit-reversed byte values, used to map data and results between
+# the reflected CRC16 used by the inverter and the unreflected CRC16
+# implemented by binascii.crc_hqx().
+_CRC16_REFLECT = bytes(int('{:08b}'.format(_b)[::-1], 2) for _b in range(256))
+
+
+def _crc16_hqx(buf):
+    """Calculate a CCITT CRC16 checksum using binascii.crc_hqx().
+
+    Functionally identical to _crc16(). The inverter CRC uses the reflected
+    polynomial 0x8408; binascii.crc_hqx() implements the equivalent
+    unreflected polynomial 0x1021 in C inside the interpreter. Bit-reversing
+    each input byte, running crc_hqx() and bit-reversing the 16 bit result
+    gives the reflected CRC while keeping the per-byte inner loop out of
+    python bytecode altogether.
+
+    Input:
+        buf: bytes or bytearray of binary packed data for which the CRC is
+             to be calculated
+
+    Returns:
+        The CRC as a two byte integer.
+    """
+
+    if not isinstance(buf, (bytes, bytearray)):
+        buf = bytes(buf)
+    # calculate the unreflected CRC over the bit-reversed input
+    crc = binascii.crc_hqx(buf.translate(_CRC16_REFLECT), 0xffff)
+    # bit-reverse the 16 bit result to obtain the reflected CRC
+    crc = _CRC16_REFLECT[crc >> 8] | (_CRC16_REFLECT[crc & 0xff] << 8)
+    return ~crc & 0xffff
+
+
+# If numba is available JIT compile the bit-by-bit CRC function, the compiled
+# result is cached so compilation only occurs on first use. If numba is not
+# available, or the JIT compilation fails for any reason (an unsupported
+# numba version, an unwritable cache directory, etc), use the binascii based
+# function instead, its inner loop also runs at C speed. The accelerator is
+# an optional nicety and must never prevent the driver loading.
+try:
+    from numba import njit
+    crc16 = njit(cache=True)(_crc16)
+    # pre-warm the JIT compiled function with a dummy call so the one-off
+    # compilation cost is not paid on the first poll of the inverter
+    _ = crc16(b'\x00')
+except ImportError:
+    crc16 = _crc16_hqx
+except Exception as e:
+    log.info("numba CRC acceleration unavailable (%s), using binascii", e)
+    crc16 = _crc16_hqx
+
+
 def format_byte_to_hex(byte_seq):
     """Format a sequence of bytes as a string of space separated hex bytes.
 
@@ -2019,18 +2505,23 @@ def format_byte_to_hex(byte_seq):
         sequence.
     """
 
-    # obtain a bytearray of the byte sequence
-    _b_array = bytearray(byte_seq)
-    # use a list comprehension to obtain a space delimited string of our byte
-    # sequence formatted as hex characters
-    return ' '.join(['%02X' % b for b in _b_array])
+    # bytes and bytearray objects can be formatted directly, only copy the
+    # byte sequence into a bytes object if we were handed something else,
+    # eg an iterable of ints
+    if not isinstance(byte_seq, (bytes, bytearray)):
+        byte_seq = bytes(byte_seq)
+    # use the C implemented hex() method to do the formatting in one pass
+    return byte_seq.hex(' ').upper()
 
 
 # ============================================================================
 #                            class ResponseTuple
 # ============================================================================
 
-class ResponseTuple(tuple):
+class ResponseTuple(collections.namedtuple('ResponseTuple',
+                                           ('transmission_state',
+                                            'global_state',
+                                            'data'))):
     """Class to represent a raw inverter command response.
 
     An inverter response consists of 8 bytes as follows:
@@ -2060,22 +2551,14 @@ class ResponseTuple(tuple):
 
     It is also valid to have a data attribute of None. In these cases the data
     could not be decoded and the driver will handle this appropriately.
-    """
 
-    def __new__(cls, *args):
-        return tuple.__new__(cls, args)
+    Implemented as a subclass of collections.namedtuple; the named attribute
+    accessors are C level itemgetters rather than python level properties,
+    and construction avoids the *args repack a hand rolled tuple subclass
+    requires. __slots__ is empty so instances carry no per-instance dict.
+    """
 
-    @property
-    def transmission_state(self):
-        return self[0]
-
-    @property
-    def global_state(self):
-        return self[1]
-
-    @property
-    def data(self):
-        return self[2]
+    __slots__ = ()
 
 
 # ============================================================================
@@ -2133,6 +2616,55 @@ class DirectAurora(object):
         'partial_energy': 'group_energy'
     }
 
+    # Layout of the live_data() display. Each entry is either a literal line
+    # (section headings, separators and spacers) or a 2-way tuple of
+    # (display label, inverter field); field entries are rendered as a right
+    # justified label followed by the converted and formatted field value.
+    LIVE_DATA_LAYOUT = (
+        "-----------------------------------------------",
+        "Grid:",
+        ('Voltage', 'grid_voltage'),
+        ('Current', 'grid_current'),
+        ('Power', 'grid_power'),
+        ('Frequency', 'frequency'),
+        ('Average Voltage', 'grid_average_voltage'),
+        ('Neutral Voltage', 'grid_voltage_neutral'),
+        ('Neutral Phase Voltage', 'grid_voltage_neutral_phase'),
+        "-----------------------------------------------",
+        "String 1:",
+        ('Voltage', 'string1_voltage'),
+        ('Current', 'string1_current'),
+        ('Power', 'string1_power'),
+        "-----------------------------------------------",
+        "String 2:",
+        ('Voltage', 'string2_voltage'),
+        ('Current', 'string2_current'),
+        ('Power', 'string2_power'),
+        "-----------------------------------------------",
+        "Inverter:",
+        ('Voltage (DC/DC Booster)', 'grid_dc_voltage'),
+        ('Frequency (DC/DC Booster)', 'grid_dc_frequency'),
+        ('Inverter Temp', 'inverter_temp'),
+        ('Booster Temp', 'booster_temp'),
+        ("Today's Peak Power", 'day_peak_power'),
+        ('Lifetime Peak Power', 'peak_power'),
+        ("Today's Energy", 'day_energy'),
+        ("This Weeks's Energy", 'week_energy'),
+        ("This Month's Energy", 'month_energy'),
+        ("This Year's Energy", 'year_energy'),
+        ('Partial Energy', 'partial_energy'),
+        ('Lifetime Energy', 'total_energy'),
+        "",
+        ('Bulk Voltage', 'bulk_voltage'),
+        ('Bulk DC Voltage', 'bulk_dc_voltage'),
+        ('Bulk Mid Voltage', 'bulk_mid_voltage'),
+        "",
+        ('Isolation Resistance', 'isolation_resistance'),
+        "",
+        ('Leakage Current(Inverter)', 'leak_current'),
+        ('Leakage Current(Booster)', 'leak_dc_current')
+    )
+
     def __init__(self, namespace, parser, **aurora_dict):
         """Initialise a DirectAurora object."""
 
@@ -2143,6 +2675,24 @@ class DirectAurora(object):
         self.aurora_dict = aurora_dict
         # obtain the command line options that override our config dict options
         self.config_from_command_line()
+        # holder for a lazily constructed AuroraDriver object, constructing a
+        # driver involves interrogating the inverter so only do it once and
+        # only when an action actually needs a driver
+        self._driver = None
+
+    @property
+    def driver(self):
+        """Return an AuroraDriver object, constructing it on first use.
+
+        Constructing an AuroraDriver opens the serial port and interrogates
+        the inverter, so the driver is constructed once on first access and
+        the same object reused for any subsequent actions. Any exception
+        raised during construction is left to the caller to handle.
+        """
+
+        if self._driver is None:
+            self._driver = AuroraDriver(**self.aurora_dict)
+        return self._driver
 
     def config_from_command_line(self):
         """Override the config dict with any command line options.
@@ -2170,26 +2720,24 @@ class DirectAurora(object):
     def process_arguments(self):
         """Call the appropriate method based on the argparse arguments."""
 
-        # run the driver
-        if hasattr(self.namespace, 'gen') and self.namespace.gen:
-            self.test_driver()
-        # display the inverter status
-        elif hasattr(self.namespace, 'status') and self.namespace.status:
-            self.status()
-        # display inverter info
-        elif hasattr(self.namespace, 'info') and self.namespace.info:
-            self.info()
-        # display current inverter data
-        elif hasattr(self.namespace, 'live_data') and self.namespace.live_data:
-            self.live_data()
-        # display the inverter time
-        elif hasattr(self.namespace, 'get_time') and self.namespace.get_time:
-            self.get_inverter_time()
-        # set the inverter time
-        elif hasattr(self.namespace, 'set_time') and self.namespace.set_time:
-            self.set_inverter_time()
-        # no valid option selected, display the help text
+        # map argparse argument name to the method that actions it, in
+        # priority order
+        _dispatch = (('gen', self.test_driver),
+                     ('status', self.status),
+                     ('info', self.info),
+                     ('live_data', self.live_data),
+                     ('get_time', self.get_inverter_time),
+                     ('set_time', self.set_inverter_time))
+        # the namespace dict lets us look up each argument once, arguments
+        # that were never defined simply come back None
+        _ns_dict = vars(self.namespace)
+        # action the first argument that was set
+        for _arg, _method in _dispatch:
+            if _ns_dict.get(_arg):
+                _method()
+                break
         else:
+            # no valid option selected, display the help text
             print()
             print("No option selected, nothing done")
             print()
@@ -2210,7 +2758,7 @@ class DirectAurora(object):
         # now get an AuroraDriver object, wrap in a try .. except to catch
         # any exceptions, particularly if the inverter is asleep
         try:
-            driver = AuroraDriver(**self.aurora_dict)
+            driver = self.driver
         except Exception as e:
             # could not load the driver, inform the user and display any error
             # message
@@ -2248,16 +2796,17 @@ class DirectAurora(object):
         # get an AuroraDriver object, wrap in a try .. except to catch any
         # exceptions, particularly if the inverter is asleep
         try:
-            driver = AuroraDriver(**self.aurora_dict)
+            driver = self.driver
         except Exception as e:
             # could not load the driver, inform the user and display any error
             # message
             print()
             print("Unable to load driver: %s" % e)
         else:
-            # get a packet containing the current DSP data
+            # get a packet containing the current DSP data, ask for the full
+            # DSP field list, the display is not limited to the sensor map
             try:
-                _current_dsp_data_dict = driver.get_dsp_packet()
+                _current_dsp_data_dict = driver.get_dsp_packet(AuroraDriver.DSP_FIELDS)
             except weewx.WeeWxIOError as e:
                 print()
                 print(f'Unable to connect to device: {e}')
@@ -2298,53 +2847,24 @@ class DirectAurora(object):
                     key_vh = weewx.units.ValueHelper(key_vt, formatter=f, converter=c)
                     # and add the converted and formatted value to our dict
                     result[key] = key_vh.toString(None_string='None')
+                # Assemble the display in a list of lines and emit it with a
+                # single print; one write to the console rather than one per
+                # line.
+                out = ['',
+                       f"{driver.model} Current Data:",
+                       f'  (using WeeWX {weewx.units.unit_nicknames.get(_unit_system)} units)',
+                       f"Inverter time: {result.get('time_date', 'no data')}"]
+                # render the body of the display from the layout table,
+                # tuple entries are (label, field) pairs and anything else
+                # is a literal line
+                for entry in DirectAurora.LIVE_DATA_LAYOUT:
+                    if isinstance(entry, tuple):
+                        _label, _field = entry
+                        out.append(f"{_label:>29}: {result.get(_field, 'no data')}")
+                    else:
+                        out.append(entry)
                 # display the data
-                print()
-                print(f"{driver.model} Current Data:")
-                print(f'  (using WeeWX {weewx.units.unit_nicknames.get(_unit_system)} units)')
-                print(f"Inverter time: {result.get('time_date', 'no data')}")
-                print("-----------------------------------------------")
-                print("Grid:")
-                print(f"{'Voltage':>29}: {result.get('grid_voltage', 'no data')}")
-                print(f"{'Current':>29}: {result.get('grid_current', 'no data')}")
-                print(f"{'Power':>29}: {result.get('grid_power', 'no data')}")
-                print(f"{'Frequency':>29}: {result.get('frequency', 'no data')}")
-                print(f"{'Average Voltage':>29}: {result.get('grid_average_voltage', 'no data')}")
-                print(f"{'Neutral Voltage':>29}: {result.get('grid_voltage_neutral', 'no data')}")
-                print(f"{'Neutral Phase Voltage':>29}: {result.get('grid_voltage_neutral_phase', 'no data')}")
-                print("-----------------------------------------------")
-                print("String 1:")
-                print(f"{'Voltage':>29}: {result.get('string1_voltage', 'no data')}")
-                print(f"{'Current':>29}: {result.get('string1_current', 'no data')}")
-                print(f"{'Power':>29}: {result.get('string1_power', 'no data')}")
-                print("-----------------------------------------------")
-                print("String 2:")
-                print(f"{'Voltage':>29}: {result.get('string2_voltage', 'no data')}")
-                print(f"{'Current':>29}: {result.get('string2_current', 'no data')}")
-                print(f"{'Power':>29}: {result.get('string2_power', 'no data')}")
-                print("-----------------------------------------------")
-                print("Inverter:")
-                print(f"""{"Voltage (DC/DC Booster)":>29}: {result.get("grid_dc_voltage", "no data")}""")
-                print(f"""{"Frequency (DC/DC Booster)":>29}: {result.get("grid_dc_frequency", "no data")}""")
-                print(f"""{"Inverter Temp":>29}: {result.get("inverter_temp", "no data")}""")
-                print(f"""{"Booster Temp":>29}: {result.get("booster_temp", "no data")}""")
-                print(f"""{"Today's Peak Power":>29}: {result.get("day_peak_power", "no data")}""")
-                print(f"""{"Lifetime Peak Power":>29}: {result.get("peak_power", "no data")}""")
-                print(f"""{"Today's Energy":>29}: {result.get("day_energy", "no data")}""")
-                print(f"""{"This Weeks's Energy":>29}: {result.get("week_energy", "no data")}""")
-                print(f"""{"This Month's Energy":>29}: {result.get("month_energy", "no data")}""")
-                print(f"""{"This Year's Energy":>29}: {result.get("year_energy", "no data")}""")
-                print(f"""{"Partial Energy":>29}: {result.get("partial_energy", "no data")}""")
-                print(f"""{"Lifetime Energy":>29}: {result.get("total_energy", "no data")}""")
-                print()
-                print(f"{'Bulk Voltage':>29}: {result.get('bulk_voltage', 'no data')}")
-                print(f"{'Bulk DC Voltage':>29}: {result.get('bulk_dc_voltage', 'no data')}")
-                print(f"{'Bulk Mid Voltage':>29}: {result.get('bulk_mid_voltage', 'no data')}")
-                print()
-                print(f"{'Isolation Resistance':>29}: {result.get('isolation_resistance', 'no data')}")
-                print()
-                print(f"{'Leakage Current(Inverter)':>29}: {result.get('leak_current', 'no data')}")
-                print(f"{'Leakage Current(Booster)':>29}: {result.get('leak_dc_current', 'no data')}")
+                print('\n'.join(out))
 
     def status(self):
         """Display the inverter status."""
@@ -2352,7 +2872,7 @@ class DirectAurora(object):
         # get an AuroraDriver object, wrap in a try .. except to catch any
         # exceptions, particularly if the inverter is asleep
         try:
-            driver = AuroraDriver(**self.aurora_dict)
+            driver = self.driver
         except Exception as e:
             # could not load the driver, inform the user and display any error
             # message
@@ -2369,40 +2889,53 @@ class DirectAurora(object):
                 print()
                 print(f'An unexpected error occurred: {e}')
             else:
-                # now display the inverter status
-                print()
-                print(f"{driver.model} Status:")
-                if driver.inverter.transmission_state is not None:
-                    print(f'{"Transmission state":>22}: {driver.inverter.transmission_state} '
-                          f'({AuroraInverter.TRANSMISSION[driver.inverter.transmission_state]})')
+                # Bind the inverter and its state lookup tables to locals,
+                # each is referenced several times below.
+                inverter = driver.inverter
+                transmission = AuroraInverter.TRANSMISSION
+                global_states = AuroraInverter.GLOBAL
+                inverter_states = AuroraInverter.INVERTER
+                dcdc = AuroraInverter.DCDC
+                alarm = AuroraInverter.ALARM
+                # Assemble the status display in a list of lines and emit it
+                # with a single print; one write to the console rather than
+                # one per line.
+                out = ['',
+                       f"{driver.model} Status:"]
+                if inverter.transmission_state is not None:
+                    out.append(f'{"Transmission state":>22}: {inverter.transmission_state} '
+                               f'({transmission[inverter.transmission_state]})')
                 else:
-                    print(f'{"Transmission state":>22}: None (---)')
-                if driver.inverter.global_state is not None:
-                    print(f'{"Global state":>22}: {driver.inverter.global_state} '
-                          f'({AuroraInverter.GLOBAL[driver.inverter.global_state]})')
+                    out.append(f'{"Transmission state":>22}: None (---)')
+                if inverter.global_state is not None:
+                    out.append(f'{"Global state":>22}: {inverter.global_state} '
+                               f'({global_states[inverter.global_state]})')
                 else:
-                    print(f'{"Global state":>22}: None (---)')
+                    out.append(f'{"Global state":>22}: None (---)')
                 if state_rt is not None and state_rt[0] is not None:
-                    print(f'{"Inverter state":>22}: {state_rt[0]} '
-                          f'({AuroraInverter.INVERTER[state_rt[0]]})')
+                    out.append(f'{"Inverter state":>22}: {state_rt[0]} '
+                               f'({inverter_states[state_rt[0]]})')
                 else:
-                    print(f'{"Inverter state":>22}: None (---)')
+                    out.append(f'{"Inverter state":>22}: None (---)')
                 if state_rt is not None and state_rt[1] is not None:
-                    print(f'{"DcDc1 state":>22}: {state_rt[1]} '
-                          f'({AuroraInverter.DCDC[state_rt[1]]})')
+                    out.append(f'{"DcDc1 state":>22}: {state_rt[1]} '
+                               f'({dcdc[state_rt[1]]})')
                 else:
-                    print(f'{"DcDc1 state":>22}: None (---)')
+                    out.append(f'{"DcDc1 state":>22}: None (---)')
                 if state_rt is not None and state_rt[2] is not None:
-                    print(f'{"DcDc2 state":>22}: {state_rt[2]} '
-                          f'({AuroraInverter.DCDC[state_rt[2]]})')
+                    out.append(f'{"DcDc2 state":>22}: {state_rt[2]} '
+                               f'({dcdc[state_rt[2]]})')
                 else:
-                    print(f'{"DcDc2 state":>22}: None (---)')
+                    out.append(f'{"DcDc2 state":>22}: None (---)')
                 if state_rt is not None and state_rt[3] is not None:
-                    print(f'{"Alarm state":>22}: {state_rt[3]} '
-                          f'({AuroraInverter.ALARM[state_rt[3]]["description"]})'
-                          f'[{AuroraInverter.ALARM[state_rt[3]]["code"]}]')
+                    _alarm_desc, _alarm_code = alarm[state_rt[3]]
+                    out.append(f'{"Alarm state":>22}: {state_rt[3]} '
+                               f'({_alarm_desc})'
+                               f'[{_alarm_code}]')
                 else:
-                    print(f'{"Alarm state":>22}: None (---)')
+                    out.append(f'{"Alarm state":>22}: None (---)')
+                # display the inverter status
+                print('\n'.join(out))
 
     def info(self):
         """Display inverter information.
@@ -2414,7 +2947,7 @@ class DirectAurora(object):
         # get an AuroraDriver object, wrap in a try .. except to catch any
         # exceptions, particularly if the inverter is asleep
         try:
-            driver = AuroraDriver(**self.aurora_dict)
+            driver = self.driver
         except Exception as e:
             # could not load the driver, inform the user and display any error
             # message
@@ -2445,7 +2978,7 @@ class DirectAurora(object):
         # get an AuroraDriver object, wrap in a try .. except to catch any
         # exceptions, particularly if the inverter is asleep
         try:
-            driver = AuroraDriver(**self.aurora_dict)
+            driver = self.driver
         except Exception as e:
             # could not load the driver, inform the user and display any error
             # message
@@ -2453,8 +2986,13 @@ class DirectAurora(object):
             print("Unable to load driver: %s" % e)
             return
         try:
-            # obtain the inverter time
+            # Obtain the inverter time. Sample the system clock either side
+            # of the exchange so the clock error can be calculated against
+            # the midpoint of the exchange rather than its end; this removes
+            # the serial round-trip time from the error.
+            _t0 = time.time()
             inverter_ts = driver.getTime()
+            _t1 = time.time()
         except Exception as e:
             # something happened and we could not get the time from the
             # inverter, inform the user and display any error message
@@ -2462,8 +3000,8 @@ class DirectAurora(object):
             print("Unable to obtain device time: %s" % e)
         else:
             # we have the inverter time, so calculate the difference to system
-            # time
-            _error = inverter_ts - time.time()
+            # time at the midpoint of the exchange
+            _error = inverter_ts - (_t0 + _t1) / 2
             # display the results
             print()
             print(f"Inverter date-time is {timestamp_to_string(inverter_ts)}")
@@ -2475,7 +3013,7 @@ class DirectAurora(object):
         # get an AuroraDriver object, wrap in a try .. except to catch any
         # exceptions, particularly if the inverter is asleep
         try:
-            driver = AuroraDriver(**self.aurora_dict)
+            driver = self.driver
         except Exception as e:
             # could not load the driver, inform the user and display any error
             # message
@@ -2483,16 +3021,22 @@ class DirectAurora(object):
             print("Unable to load driver: %s" % e)
             return
         try:
-            # obtain the inverter time
+            # Obtain the inverter time. Sample the system clock either side
+            # of the exchange so the clock error can be calculated against
+            # the midpoint of the exchange rather than its end; this removes
+            # the serial round-trip time from the error.
+            _t0 = time.time()
             inverter_ts = driver.getTime()
+            _t1 = time.time()
         except Exception as e:
             # something happened and we could not get the time from the
             # inverter, inform the user and display any error message
             print()
             print("Unable to obtain device time: %s" % e)
         else:
-            # calculate the difference to system time
-            _error = inverter_ts - time.time()
+            # calculate the difference to system time at the midpoint of the
+            # exchange
+            _error = inverter_ts - (_t0 + _t1) / 2
             # display the results
             print()
             print(f"Current inverter date-time is {timestamp_to_string(inverter_ts)}")
@@ -2502,9 +3046,12 @@ class DirectAurora(object):
             # set the inverter time to the system time
             driver.setTime()
             print("Successfully set inverter date-time")
-            # now obtain and display the inverter time
+            # now obtain and display the inverter time, again calculating
+            # the error against the midpoint of the exchange
+            _t0 = time.time()
             inverter_ts = driver.getTime()
-            _error = inverter_ts - time.time()
+            _t1 = time.time()
+            _error = inverter_ts - (_t0 + _t1) / 2
             print()
             print(f"Current inverter date-time is {timestamp_to_string(inverter_ts)}")
             print(f"    Clock error is {_error:.3f} seconds (positive is fast)")
@@ -2535,21 +3082,9 @@ where:
   --set-time      - set inverter time to the current system time
 """
 
-
-def main():
-
-    # python imports
-    import argparse
-    import sys
-
-    # WeeWX imports
-    import weecfg
-    import weeutil.logger
-
-    from weeutil.weeutil import bcolors, to_sorted_string
-
-    usage = f"""{bcolors.BOLD}%(prog)s --help
-                 --version 
+# usage banner displayed by main(), built once at import time
+_MAIN_USAGE = f"""{bcolors.BOLD}%(prog)s --help
+                 --version
                  --gen-packets
                     [FILENAME|--config=FILENAME]
                     [--port=PORT] [poll_interval=POLL_INTERVAL]
@@ -2557,7 +3092,7 @@ def main():
                  --live-data
                     [FILENAME|--config=FILENAME]
                     [--port=PORT] [--units=UNIT_SYSTEM]
-                 --status 
+                 --status
                     [FILENAME|--config=FILENAME]
                  --info
                     [FILENAME|--config=FILENAME]
@@ -2566,9 +3101,17 @@ def main():
                  --set-time
                     [FILENAME|--config=FILENAME]{bcolors.ENDC}
     """
+
+
+def main():
+
+    # python imports
+    import argparse
+    import sys
+
     description = """Interact with a Power One Aurora inverter."""
 
-    parser = argparse.ArgumentParser(usage=usage,
+    parser = argparse.ArgumentParser(usage=_MAIN_USAGE,
                                      description=description,
                                      formatter_class=argparse.RawDescriptionHelpFormatter)
 
@@ -2579,30 +3122,34 @@ def main():
     parser.add_argument('--version',
                         action='store_true',
                         help='Display driver version.')
-    parser.add_argument('--gen-packets',
-                        dest='gen',
-                        action='store_true',
-                        help='Output LOOP packets indefinitely.')
-    parser.add_argument('--live-data',
-                        dest='live_data',
-                        action='store_true',
-                        help='Display current inverter data.')
-    parser.add_argument('--status',
-                        dest='status',
-                        action='store_true',
-                        help='Display inverter status.')
-    parser.add_argument('--info',
-                        dest='info',
-                        action='store_true',
-                        help='Display inverter information.')
-    parser.add_argument('--get-time',
-                        dest='get_time',
-                        action='store_true',
-                        help='Display current inverter date-time.')
-    parser.add_argument('--set-time',
-                        dest='set_time',
-                        action='store_true',
-                        help='Set inverter date-time to the current system date-time.')
+    # the action options are mutually exclusive, let argparse enforce that
+    # and reject conflicting combinations rather than silently actioning
+    # whichever option is checked first
+    action_group = parser.add_mutually_exclusive_group()
+    action_group.add_argument('--gen-packets',
+                              dest='gen',
+                              action='store_true',
+                              help='Output LOOP packets indefinitely.')
+    action_group.add_argument('--live-data',
+                              dest='live_data',
+                              action='store_true',
+                              help='Display current inverter data.')
+    action_group.add_argument('--status',
+                              dest='status',
+                              action='store_true',
+                              help='Display inverter status.')
+    action_group.add_argument('--info',
+                              dest='info',
+                              action='store_true',
+                              help='Display inverter information.')
+    action_group.add_argument('--get-time',
+                              dest='get_time',
+                              action='store_true',
+                              help='Display current inverter date-time.')
+    action_group.add_argument('--set-time',
+                              dest='set_time',
+                              action='store_true',
+                              help='Set inverter date-time to the current system date-time.')
     parser.add_argument('--port',
                         type=str,
                         metavar="PORT",
@@ -2628,7 +3175,11 @@ def main():
         print(f"Aurora driver version {DRIVER_VERSION}")
         sys.exit(0)
 
-    # any other options will require an AuroraDriver object
+    # any other options will require an AuroraDriver object so now import
+    # the config and logging machinery
+    import weecfg
+    import weeutil.logger
+
     # first get the config_dict to use
     config_path, config_dict = weecfg.read_config(namespace.config)
     print(f"Using configuration file '{config_path}'")